@@ -1,29 +1,52 @@
-import nltk
+import time
+import numpy as np
 from collections import Counter
-from textblob import TextBlob
-from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
-from sklearn.decomposition import LatentDirichletAllocation, NMF
+from functools import partial
 from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+from document import TokenizedDocument
+from topics import analyze_topics
+from sentiment import score_sentences
+from summarizer import summary_sentences
+from preprocessing import iter_clean_tokens
+from cache import content_hasher, cache_key, cache_get, cache_put
+from stages import run_stages, timed, EXECUTOR, MAX_WORKERS
 
-nltk.download("punkt", quiet=True)
-
-def analyze_text(text, cleaned_text):
-    sentences = nltk.sent_tokenize(text)
-    words = text.split()
-    sentiment_labels = []
-    sentiment_polarities = {"Positive": [], "Neutral": [], "Negative": []}
-
-    for s in sentences:
-        polarity = TextBlob(s).sentiment.polarity
-        if polarity > 0.05:
-            sentiment_labels.append("Positive")
-            sentiment_polarities["Positive"].append(polarity)
-        elif polarity < -0.05:
-            sentiment_labels.append("Negative")
-            sentiment_polarities["Negative"].append(polarity)
-        else:
-            sentiment_labels.append("Neutral")
-            sentiment_polarities["Neutral"].append(polarity)
+# Bump when the analysis output changes so stale cache entries are ignored.
+ANALYSIS_VERSION = 6
+CLOUD_WORDS = 60
+HASH_BLOCK_SIZE = 1 << 20
+
+def _keyword_stage(doc):
+    term_counts = doc.term_counts()
+    return [doc.words[i] for i in np.argsort(-term_counts, kind="stable")[:10]]
+
+
+def _topic_stage(doc, update=True):
+    if doc.n_tokens > 5:
+        return analyze_topics(doc, update=update)
+    return {"lda": [], "nmf": []}, {"lda": [], "nmf": []}
+
+
+def analyze_text(text, update_topics=True, executor=EXECUTOR, max_workers=MAX_WORKERS):
+    doc, tokenize_timing = timed(TokenizedDocument.from_text, text)
+    return analyze_document(doc, tokenize_timing, update_topics, executor, max_workers)
+
+
+def analyze_document(doc, tokenize_timing=None, update_topics=True, executor=EXECUTOR, max_workers=MAX_WORKERS):
+    start = time.perf_counter()
+
+    stages = {
+        "sentiment": score_sentences,
+        "keywords": _keyword_stage,
+        "topics": partial(_topic_stage, update=update_topics),
+        "summary": summary_sentences,
+    }
+    results, stage_timings = run_stages(stages, (doc,), executor=executor, max_workers=max_workers)
+    sentiment_labels, sentiment_polarities = results["sentiment"]
+    top_keywords = results["keywords"]
+    topics, topic_weights = results["topics"]
+    # Sentence text stays in this process; the stage only picks indices.
+    summary = " ".join(doc.sentences_at(results["summary"]))
 
     counts = Counter(sentiment_labels)
     overall = counts.most_common(1)[0][0] if counts else "Neutral"
@@ -31,55 +54,69 @@ def analyze_text(text, cleaned_text):
     overall_polarity = round(
         sum(sentiment_polarities.get(overall, [0])) / max(len(sentiment_polarities.get(overall, [])), 1),
         3
-    )    
-    top_keywords = [w for w, _ in Counter(cleaned_text.split()).most_common(10)]
-    topics = {"lda": [], "nmf": []}
-    if cleaned_text.strip() and len(cleaned_text.split()) > 5:
-        cv = CountVectorizer(max_features=100, stop_words="english")
-        X = cv.fit_transform([cleaned_text])
-        lda = LatentDirichletAllocation(n_components=3, random_state=42)
-        lda.fit(X)
-        words_lda = cv.get_feature_names_out()
-        for idx, topic in enumerate(lda.components_):
-            top_words = [words_lda[i] for i in topic.argsort()[-6:]]
-            topics["lda"].append(f"Topic {idx+1}: {', '.join(top_words)}")
-        tfidf = TfidfVectorizer(max_features=100, stop_words="english")
-        X2 = tfidf.fit_transform([cleaned_text])
-        nmf = NMF(n_components=3, random_state=42)
-        nmf.fit(X2)
-        words_nmf = tfidf.get_feature_names_out()
-        for idx, topic in enumerate(nmf.components_):
-            top_words = [words_nmf[i] for i in topic.argsort()[-6:]]
-            topics["nmf"].append(f"Topic {idx+1}: {', '.join(top_words)}")
-    words_lower = [w.lower() for w in text.split() if w.lower() not in ENGLISH_STOP_WORDS]
-    word_freq = Counter(words_lower)
-
-    sentence_scores = {}
-    for s in sentences:
-        score = 0
-        for w in s.lower().split():
-            if w in word_freq:
-                score += word_freq[w]
-        sentence_scores[s] = score
-
-    num_sentences = max(1, int(len(sentences)*0.2))
-    summary_sentences = sorted(sentence_scores, key=sentence_scores.get, reverse=True)[:num_sentences]
-    summary = " ".join(summary_sentences)
+    )
     insights = [
-        f"Text contains {len(words)} words.",
+        f"Text contains {doc.n_tokens} words.",
         f"Overall sentiment is {overall}.",
         "Key themes identified using topic modeling.",
         "Refinement may improve clarity and tone."
     ]
 
     return {
-        "word_count": len(words),
-        "sentence_count": len(sentences),
+        "word_count": doc.n_tokens,
+        "sentence_count": doc.n_sentences,
         "overall_sentiment": overall,
         "polarity_score": overall_polarity,
         "sentiment_distribution": dict(counts),
         "top_keywords": top_keywords,
         "topics": topics,
+        "topic_weights": topic_weights,
         "summary": summary,
-        "insights": insights
+        "insights": insights,
+        "timings": {
+            "executor": executor,
+            "tokenize": tokenize_timing,
+            "stages": stage_timings,
+            "total_wall": round(time.perf_counter() - start, 4),
+        }
+    }
+
+
+def keyword_tables(doc):
+    sentences = (s + " " for s in doc.iter_sentences())
+    filtered_words = [
+        w for w in iter_clean_tokens(sentences) if w not in ENGLISH_STOP_WORDS and len(w) > 2
+    ]
+    counter = Counter(filtered_words)
+    return {
+        "keyword_freq": counter.most_common(8),
+        "cloud_freq": counter.most_common(CLOUD_WORDS),
     }
+
+
+def file_key(file, kind):
+    # Cache key for an upload: the raw bytes and how they are read, hashed
+    # before anything is parsed or tokenized. Rewinds the file afterwards.
+    hasher = content_hasher(version=ANALYSIS_VERSION, kind=kind)
+    for raw in iter(lambda: file.read(HASH_BLOCK_SIZE), b""):
+        hasher.update(raw)
+    file.seek(0)
+    return hasher.hexdigest()
+
+
+def analyze_blocks(blocks, key=None, update_topics=True, executor=EXECUTOR):
+    # Cached analysis of a document that arrives as text blocks. The cache
+    # is checked before the blocks are touched, so with a lazy generator a
+    # hit reads and tokenizes nothing. Without a key nothing is cached.
+    result = cache_get(key) if key else None
+    if result is None:
+        doc, tokenize_timing = timed(TokenizedDocument.from_blocks, blocks)
+        result = analyze_document(doc, tokenize_timing, update_topics, executor)
+        result.update(keyword_tables(doc))
+        if key:
+            cache_put(key, result)
+    return result
+
+
+def analyze_cached(text):
+    return analyze_blocks([text], cache_key(text, version=ANALYSIS_VERSION))
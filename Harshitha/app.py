@@ -2,33 +2,47 @@ import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import streamlit as st
-import PyPDF2
-import docx2txt
 import pandas as pd
-from analysis import analyze_text
+from analysis import analyze_cached, analyze_blocks, file_key
+from ingest import iter_blocks
 from utils import generate_report
-from preprocessing import clean_text
-from wordcloud import WordCloud
-from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
-from collections import Counter
+from cloud import cached_png, render_png, render_async, PREVIEW_SIZE
 import numpy as np
-from PIL import Image
 import numpy as np
 
-def show_wordcloud(text):
-    if not text or not text.strip():
+PREVIEW_CHARS = 200_000
+
+CLOUD_POLL_SECONDS = 1
+
+
+@st.fragment(run_every=CLOUD_POLL_SECONDS)
+def _pending_wordcloud(freq):
+    # Shows the preview while the full-size cloud renders in the background,
+    # polling only this fragment. Once the full render is cached, one app
+    # rerun shows it through show_wordcloud and the polling stops.
+    if cached_png(freq) is not None:
+        st.rerun()
+    st.image(
+        render_png(freq, PREVIEW_SIZE),
+        caption="Word Cloud (preview, rendering full size...)",
+        width=850
+    )
+
+
+def show_wordcloud(freq):
+    # Shows the cached full-size cloud if there is one; otherwise starts the
+    # full render and shows a quick preview without waiting for it.
+    if not freq:
         st.warning("No text available for Word Cloud.")
         return
 
-    wc = WordCloud(
-        width=1200,
-        height=800,
-        background_color="white",
-        max_words=60
-    ).generate(text)
+    full = cached_png(freq)
+    if full is not None:
+        st.image(full, caption="Word Cloud", width=850)
+        return
 
-    img = Image.fromarray(wc.to_array())
-    st.image(img, caption="Word Cloud", width=850)
+    render_async(freq)
+    _pending_wordcloud(freq)
 
 st.set_page_config("NarrativeNexus", layout="wide")
 
@@ -92,32 +106,48 @@ tab1, tab2, tab3 = st.tabs(["Upload Files", "Paste Text", "Analyzed Text"])
 
 with tab1:
     file = st.file_uploader("Upload TXT, PDF, DOCX, CSV", type=["txt", "pdf", "docx", "csv"])
-    if file:
-        text = ""
+    if file and st.button("Analyze Text", key="upload"):
+        progress = st.progress(0.0, text="Reading file...")
+        preview = []
+
+        def keep_preview(blocks):
+            # Only the first PREVIEW_CHARS are kept for display; the rest of
+            # the file is tokenized block by block and then dropped.
+            kept = 0
+            for block in blocks:
+                if kept < PREVIEW_CHARS:
+                    preview.append(block[:PREVIEW_CHARS - kept])
+                    kept += len(preview[-1])
+                yield block
+
+        def on_progress(fraction):
+            progress.progress(fraction, text=f"Reading file... {fraction:.0%}")
+
         try:
-            if file.type == "application/pdf":
-                reader = PyPDF2.PdfReader(file)
-                text = " ".join(p.extract_text() for p in reader.pages if p.extract_text())
-            elif file.type.endswith("csv"):
-                text = " ".join(pd.read_csv(file, dtype=str).fillna("").astype(str).values.flatten())
-            elif file.type.endswith("docx"):
-                text = docx2txt.process(file)
-            else:
-                text = file.getvalue().decode("utf-8", errors="ignore")
+            with st.spinner("Analyzing text..."):
+                analysis = analyze_blocks(keep_preview(iter_blocks(file, on_progress)),
+                                          file_key(file, file.type))
+                if not preview:
+                    # A cache hit reads nothing; fetch just the preview.
+                    for _ in keep_preview(iter_blocks(file)):
+                        if sum(map(len, preview)) >= PREVIEW_CHARS:
+                            break
         except Exception as e:
             st.error(e)
-
-        if text and st.button("Analyze Text", key="upload"):
-            with st.spinner("Analyzing text..."):
-                st.session_state.analysis = analyze_text(text, text.lower())
-                st.session_state.text = text
-            st.success("Text analyzed successfully")
+        else:
+            if analysis.get("word_count"):
+                st.session_state.analysis = analysis
+                st.session_state.text = " ".join(preview)
+                st.success("Text analyzed successfully")
+            else:
+                st.warning("No text could be extracted from this file.")
+        progress.empty()
 
 with tab2:
     text = st.text_area("Paste your text", height=200)
     if text and st.button("Analyze Text", key="paste"):
         with st.spinner("Analyzing text..."):
-            st.session_state.analysis = analyze_text(text, text.lower())
+            st.session_state.analysis = analyze_cached(text)
             st.session_state.text = text
         st.success("Text analyzed successfully")
 
@@ -188,14 +218,9 @@ with tab3:
 
         st.subheader("Top Keywords (Frequency Analysis):")
 
-        words = clean_text(st.session_state.text).split()
-        filtered_words = [
-            w for w in words if w not in ENGLISH_STOP_WORDS and len(w) > 2
-        ]
+        top_words = a.get("keyword_freq", [])
 
-        if filtered_words:
-            counter = Counter(filtered_words)
-            top_words = counter.most_common(8)
+        if top_words:
             df_keywords = pd.DataFrame(top_words, columns=["Keyword", "Frequency"])
 
             col1, col2 = st.columns([1, 1])
@@ -226,7 +251,7 @@ with tab3:
             st.info("No keywords available")
 
         st.subheader("Word Cloud:")
-        show_wordcloud(" ".join(filtered_words[:100]))
+        show_wordcloud(dict(a.get("cloud_freq", [])))
 
         st.subheader("Topic Modeling:")
 
@@ -255,4 +280,4 @@ with tab3:
             label="Download Report",
             data=report.encode("utf-8"),
             file_name="narrativenexus_report.txt"
-        )
\ No newline at end of file
+        )
@@ -0,0 +1,145 @@
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import numpy as np
+
+from analysis import analyze_blocks, file_key
+from document import TokenizedDocument
+from ingest import READERS, iter_path_blocks
+from topics import TopicEngine
+from utils import generate_report
+
+EXTENSIONS = tuple(f".{ext}" for ext in READERS)
+FIT_SAMPLE_DOCS = 50
+
+
+def find_documents(inputs):
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, _, files in os.walk(item):
+                paths.extend(os.path.join(root, f) for f in files if f.lower().endswith(EXTENSIONS))
+        elif os.path.isfile(item):
+            paths.append(item)
+        else:
+            paths.extend(p for p in glob.glob(item, recursive=True)
+                         if os.path.isfile(p) and p.lower().endswith(EXTENSIONS))
+    return sorted(set(paths))
+
+
+def fit_topics(paths, sample=FIT_SAMPLE_DOCS):
+    # Runs in the parent before the pool starts. Workers only score against
+    # the saved engine, so on a machine without one every document would
+    # get empty topics. Fits on documents spread evenly over the batch.
+    engine = TopicEngine.load()
+    step = max(1, len(paths) // sample)
+    for path in paths[::step][:sample]:
+        try:
+            doc = TokenizedDocument.from_blocks(iter_path_blocks(path))
+        except Exception:
+            continue
+        if doc.n_tokens > 5:
+            engine.partial_fit([doc])
+    if engine.fitted:
+        engine.save()
+    return engine.fitted
+
+
+def analyze_path(path, use_cache=True):
+    # Runs in a worker process. Topics are scored against the saved engine
+    # without updating it, so workers never race on the engine state file.
+    start = time.perf_counter()
+    size = os.path.getsize(path)
+    try:
+        key = None
+        if use_cache:
+            with open(path, "rb") as f:
+                key = file_key(f, os.path.splitext(path)[1].lower())
+        a = analyze_blocks(iter_path_blocks(path), key, update_topics=False, executor="serial")
+        record = {"path": path, "bytes": size, "analysis": a, "report": generate_report("", a)}
+    except Exception as e:
+        record = {"path": path, "bytes": size, "error": f"{type(e).__name__}: {e}"}
+    record["latency_s"] = round(time.perf_counter() - start, 4)
+    return record
+
+
+def run(paths, out, workers, use_cache=True, fit="auto"):
+    # fit: "auto" fits the topic engine only when none is saved yet,
+    # "always" also updates a saved one, "never" skips fitting.
+    start = time.perf_counter()
+    if fit == "always" or (fit == "auto" and not TopicEngine.load().fitted):
+        fit_topics(paths)
+    latencies = []
+    total_bytes = 0
+    errors = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Keep a bounded number of documents in flight so the futures for a
+        # large batch are not all held at once.
+        todo = iter(paths)
+        in_flight = set()
+        while True:
+            while len(in_flight) < workers * 4:
+                path = next(todo, None)
+                if path is None:
+                    break
+                in_flight.add(pool.submit(analyze_path, path, use_cache))
+            if not in_flight:
+                break
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                record = future.result()
+                out.write(json.dumps(record, default=str) + "\n")
+                latencies.append(record["latency_s"])
+                total_bytes += record["bytes"]
+                errors += "error" in record
+    elapsed = time.perf_counter() - start
+    lat = np.array(latencies) if latencies else np.zeros(1)
+    return {
+        "documents": len(latencies),
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "docs_per_s": round(len(latencies) / elapsed, 3) if elapsed else 0.0,
+        "mb_per_s": round(total_bytes / 1e6 / elapsed, 3) if elapsed else 0.0,
+        "latency_p50_s": round(float(np.percentile(lat, 50)), 4),
+        "latency_p99_s": round(float(np.percentile(lat, 99)), 4),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Analyze a batch of TXT/PDF/DOCX/CSV documents, one JSON line per document."
+    )
+    parser.add_argument("inputs", nargs="+", help="files, directories or glob patterns")
+    parser.add_argument("-o", "--output", help="JSON lines output file (default: stdout)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--stats", help="also write the throughput stats JSON to this file")
+    parser.add_argument("--no-cache", action="store_true", help="skip the analysis result cache")
+    parser.add_argument("--fit-topics", choices=["auto", "always", "never"], default="auto",
+                        help="fit the topic engine on a sample of the batch first "
+                             "(auto: only when no fitted engine is saved)")
+    args = parser.parse_args(argv)
+
+    paths = find_documents(args.inputs)
+    if not paths:
+        parser.error("no TXT/PDF/DOCX/CSV documents found")
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        stats = run(paths, out, max(1, args.workers), use_cache=not args.no_cache, fit=args.fit_topics)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(json.dumps(stats), file=sys.stderr)
+    if args.stats:
+        with open(args.stats, "w", encoding="utf-8") as f:
+            json.dump(stats, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import io
+import re
+import sys
+import time
+import numpy as np
+import preprocessing
+from preprocessing import STOP, LEM, clean_text, iter_clean_tokens
+
+
+def clean_text_baseline(text):
+    # Implementation before the memoized normalizer, kept for comparison.
+    text = re.sub(r"[^a-zA-Z ]", " ", text.lower())
+    tokens = [LEM.lemmatize(t) for t in text.split() if t not in STOP and len(t) > 2]
+    return " ".join(tokens)
+
+
+def zipf_corpus(n_words, vocab_size=50000, a=1.1, seed=42):
+    rng = np.random.default_rng(seed)
+    letters = np.array(list("abcdefghijklmnopqrstuvwxyz"))
+    vocab = ["".join(rng.choice(letters, size=rng.integers(3, 10))) for _ in range(vocab_size)]
+    vocab[:len(STOP)] = sorted(STOP)
+    ranks = np.minimum(rng.zipf(a, size=n_words), vocab_size) - 1
+    words = [vocab[r] for r in ranks]
+    for i in range(0, n_words, 12):
+        words[i] = words[i].capitalize() + ","
+    return " ".join(words)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - start
+
+
+def run(n_words):
+    text = zipf_corpus(n_words)
+    mb = len(text) / 1e6
+
+    preprocessing._normalize_token.cache_clear()
+    expected, baseline = timed(clean_text_baseline, text)
+    result, cold = timed(clean_text, text)
+    _, warm = timed(clean_text, text)
+    streamed, stream = timed(lambda: " ".join(iter_clean_tokens(io.StringIO(text), 1 << 16)))
+    assert result == expected and streamed == expected
+
+    print(f"{n_words:>9} words ({mb:6.1f} MB) | baseline {baseline:7.2f}s | "
+          f"memo cold {cold:6.2f}s | memo warm {warm:6.2f}s | stream {stream:6.2f}s | "
+          f"speedup {baseline / cold:5.1f}x")
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [100_000, 1_000_000, 5_000_000]
+    for n in sizes:
+        run(n)
@@ -0,0 +1,145 @@
+import random
+import sys
+import time
+import numpy as np
+from textblob import TextBlob
+from document import TokenizedDocument
+from sentiment import score_sentences, sentence_polarities, POSITIVE_THRESHOLD, NEGATIVE_THRESHOLD
+
+FILLER = ["the", "report", "team", "a", "meeting", "customer", "service", "was", "is", "it",
+          "product", "and", "we", "they", "delivery", "support", "call", "update", "this", "of"]
+OPINION = ["good", "great", "bad", "terrible", "happy", "slow", "excellent", "poor", "nice",
+           "awful", "helpful", "useless", "amazing", "disappointing", "fine", "late"]
+MODIFIERS = ["very", "really", "extremely", "quite"]
+NEGATIONS = ["not", "never", "no"]
+EXTRAS = ["well-made", "so-so", "isn't", "don't", ":)", ":(", ":D", "GREAT", "(!)"]
+
+# Ordinary sentences with the constructs generated text rarely has:
+# contractions, hyphenated words, capitals, emoticons, modifier chains,
+# negation before and after a modifier, and detached exclamation marks.
+REAL_SENTENCES = [
+    "Absolutely not recommended.",
+    "Honestly, it isn't bad :) but the staff were very very rude.",
+    "What a well-made, beautifully-crafted product.",
+    "GREAT JOB team!",
+    "The food was really not good.",
+    "I love it :-(",
+    "This is a so-so result.",
+    "Not bad at all!",
+    "The service was not very good.",
+    "We were never happy with the delivery.",
+    "It's pretty good, I guess :D",
+    "The room was clean but the bed was awful!!",
+    "Totally worth it.",
+    "I don't think this is a good idea.",
+    "The support team was extremely helpful and very patient.",
+    "Not a great experience, to be honest.",
+    "The update is really, really slow on older phones.",
+    "I'm not sure the new design is an improvement.",
+    "Wow, that was quick!",
+    "The hotel was nice; the breakfast, however, was terrible.",
+    "It works fine, nothing special.",
+    "Customer service? Useless.",
+    "Best purchase I've made this year!",
+    "The screen is bright and sharp, but the battery life is disappointing.",
+    "Shipping was late again (!)",
+    "Never buying from them again.",
+    "The app crashes constantly and the developers don't care.",
+    "A truly excellent, well-written report.",
+    "The results were not entirely unexpected.",
+    "It's OK, I suppose.",
+    "They were super friendly :)",
+    "The plot is thin, the acting is worse, and the ending is just silly.",
+    "Nothing about this felt rushed or cheap.",
+    "I would definitely recommend it to a friend.",
+    "The meeting was long and not very productive.",
+    "Such a beautiful day!",
+    "The instructions are confusing and badly translated.",
+    "Not the worst, not the best.",
+    "This is the most user-friendly tool I have used.",
+    "The price is a bit high, but the quality is outstanding.",
+    "I really hated the new layout at first.",
+    "Very happy with the quick response!",
+    "The package arrived damaged, which was very annoying.",
+    "Good value for money, though the strap feels flimsy.",
+    "Everything was perfect, thank you!!",
+    "The coffee was cold and the waiter seemed bored.",
+    "It is not really that bad.",
+    "I'm so disappointed :(",
+    "Seriously impressive work, everyone.",
+    "The second half drags, but the first half is brilliant.",
+]
+
+
+def make_sentences(n, seed=42):
+    rng = random.Random(seed)
+    sentences = []
+    for _ in range(n):
+        words = rng.sample(FILLER, rng.randint(4, 10))
+        for _ in range(rng.randint(0, 2)):
+            phrase = [rng.choice(OPINION)]
+            r = rng.random()
+            if r < 0.2:
+                phrase.insert(0, rng.choice(MODIFIERS))
+            elif r < 0.35:
+                phrase.insert(0, rng.choice(NEGATIONS))
+            elif r < 0.45:
+                phrase[:0] = [rng.choice(MODIFIERS), rng.choice(NEGATIONS)]
+            elif r < 0.55:
+                phrase[:0] = [rng.choice(NEGATIONS), rng.choice(MODIFIERS)]
+            words.insert(rng.randint(0, len(words)), " ".join(phrase))
+        if rng.random() < 0.2:
+            words.insert(rng.randint(0, len(words)), rng.choice(EXTRAS))
+        end = "!" if rng.random() < 0.1 else "."
+        sentence = " ".join(words)
+        sentences.append(sentence[0].upper() + sentence[1:] + end)
+    return sentences
+
+
+def textblob_scores(sentences):
+    return np.array([TextBlob(s).sentiment.polarity for s in sentences])
+
+
+def label(p):
+    return np.where(p > POSITIVE_THRESHOLD, 1, np.where(p < NEGATIVE_THRESHOLD, -1, 0))
+
+
+def run(n):
+    text = " ".join(make_sentences(n))
+    doc = TokenizedDocument.from_text(text)
+
+    start = time.perf_counter()
+    sentences = list(doc.iter_sentences())
+    reference = textblob_scores(sentences)
+    baseline = time.perf_counter() - start
+
+    # The batched timing includes building the shared document.
+    start = time.perf_counter()
+    score_sentences(TokenizedDocument(sentences))
+    batched = time.perf_counter() - start
+
+    fast = sentence_polarities(doc)
+    mad = float(np.mean(np.abs(fast - reference)))
+    agreement = float(np.mean(label(fast) == label(reference)))
+    print(f"{n:>7} sentences | textblob {baseline:8.2f}s | batched {batched:7.3f}s | "
+          f"speedup {baseline / max(batched, 1e-9):7.1f}x | MAD {mad:.4f} | labels {agreement:.1%}")
+
+
+def run_real(worst=5):
+    doc = TokenizedDocument(REAL_SENTENCES)
+    reference = textblob_scores(REAL_SENTENCES)
+    fast = sentence_polarities(doc)
+    diff = np.abs(fast - reference)
+    agreement = float(np.mean(label(fast) == label(reference)))
+    print(f"{len(REAL_SENTENCES):>7} real sentences | MAD {diff.mean():.4f} | "
+          f"max diff {diff.max():.3f} | labels {agreement:.1%}")
+    for i in np.argsort(-diff)[:worst]:
+        if diff[i] > 0.005:
+            print(f"    {fast[i]:+.3f} vs {reference[i]:+.3f}  {REAL_SENTENCES[i]}")
+
+
+if __name__ == "__main__":
+    run_real()
+    sizes = [int(a) for a in sys.argv[1:]] or [1000, 10000, 100000]
+    for n in sizes:
+        run(n)
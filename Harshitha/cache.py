@@ -0,0 +1,77 @@
+import hashlib
+import json
+import os
+import pickle
+import threading
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".nexus_cache", "results")
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+_lock = threading.Lock()
+
+
+def content_hasher(**params):
+    h = hashlib.sha256()
+    h.update(json.dumps(params, sort_keys=True).encode("utf-8"))
+    h.update(b"\0")
+    return h
+
+
+def cache_key(text, **params):
+    h = content_hasher(**params)
+    h.update(text.encode("utf-8", errors="ignore"))
+    return h.hexdigest()
+
+
+def _path(key):
+    return os.path.join(CACHE_DIR, f"{key}.pkl")
+
+
+def cache_get(key):
+    path = _path(key)
+    try:
+        with open(path, "rb") as f:
+            value = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return value
+
+
+def cache_put(key, value):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _path(key)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+    _evict()
+
+
+def _evict(max_bytes=MAX_CACHE_BYTES):
+    # Least recently used first: cache_get refreshes the mtime on every hit.
+    with _lock:
+        entries = []
+        total = 0
+        for entry in os.scandir(CACHE_DIR):
+            if not entry.name.endswith(".pkl"):
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, entry.path))
+            total += st.st_size
+        if total <= max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= max_bytes:
+                break
@@ -0,0 +1,51 @@
+import io
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from wordcloud import WordCloud
+from cache import cache_key, cache_get, cache_put
+
+FULL_SIZE = (1200, 800)
+PREVIEW_SIZE = (300, 200)
+MAX_WORDS = 60
+
+_pool = ThreadPoolExecutor(max_workers=2)
+_pending = {}
+_lock = threading.Lock()
+
+
+def _key(freq, size):
+    table = json.dumps(sorted(freq.items()))
+    return cache_key(table, kind="wordcloud", width=size[0], height=size[1], max_words=MAX_WORDS)
+
+
+def cached_png(freq, size=FULL_SIZE):
+    return cache_get(_key(freq, size))
+
+
+def render_png(freq, size=FULL_SIZE):
+    key = _key(freq, size)
+    png = cache_get(key)
+    if png is None:
+        wc = WordCloud(
+            width=size[0],
+            height=size[1],
+            background_color="white",
+            max_words=MAX_WORDS
+        ).generate_from_frequencies(freq)
+        buf = io.BytesIO()
+        wc.to_image().save(buf, format="PNG")
+        png = buf.getvalue()
+        cache_put(key, png)
+    return png
+
+
+def render_async(freq, size=FULL_SIZE):
+    # One background render per table/size, however many reruns ask for it.
+    key = _key(freq, size)
+    with _lock:
+        future = _pending.get(key)
+        if future is None:
+            future = _pending[key] = _pool.submit(render_png, freq, size)
+            future.add_done_callback(lambda _: _pending.pop(key, None))
+        return future
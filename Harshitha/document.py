@@ -0,0 +1,123 @@
+import sys
+import tempfile
+import threading
+from array import array
+import nltk
+import numpy as np
+
+nltk.download("punkt", quiet=True)
+
+# Sentence text beyond this many bytes is spooled to a temporary file.
+SPOOL_MAX_SIZE = 1 << 20
+
+
+class TokenizedDocument:
+    # One tokenization of a request's text, shared by every analysis stage.
+    # Tokens are the lower-cased whitespace-separated words of each sentence;
+    # token_ids[sent_offsets[i]:sent_offsets[i + 1]] are the tokens of
+    # sentence i, and words[token_id] gives the interned string back.
+    # Token ids and offsets grow in flat arrays as sentences arrive, and the
+    # sentence text is spooled as UTF-8 (to disk past SPOOL_MAX_SIZE), so
+    # only the sentences asked for are ever held as strings.
+
+    def __init__(self, sentences=()):
+        self.vocab = {}
+        self.words = []
+        self._spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        self._spool_lock = threading.Lock()
+        ids = array("i")
+        offsets = array("q", [0])
+        text_offsets = array("q", [0])
+        vocab = self.vocab
+        n = 0
+        for s in sentences:
+            for w in s.lower().split():
+                idx = vocab.get(w)
+                if idx is None:
+                    idx = vocab[w] = len(self.words)
+                    self.words.append(sys.intern(w))
+                ids.append(idx)
+            offsets.append(len(ids))
+            n += self._spool.write(s.encode("utf-8", "surrogatepass"))
+            text_offsets.append(n)
+        self.token_ids = np.frombuffer(ids, dtype=np.int32) if ids else np.zeros(0, dtype=np.int32)
+        self.sent_offsets = np.frombuffer(offsets, dtype=np.int64)
+        self._text_offsets = np.frombuffer(text_offsets, dtype=np.int64)
+
+    def __getstate__(self):
+        # Process-pool stages get the tokens only; sentence text stays with
+        # the process that built the document.
+        state = self.__dict__.copy()
+        state["_spool"] = state["_spool_lock"] = None
+        return state
+
+    @classmethod
+    def from_text(cls, text):
+        return cls(nltk.sent_tokenize(text))
+
+    @classmethod
+    def from_blocks(cls, blocks):
+        # Sentence-split each block as it arrives so the caller never has to
+        # hold the joined document text.
+        return cls(s for block in blocks for s in nltk.sent_tokenize(block))
+
+    @property
+    def n_sentences(self):
+        return len(self.sent_offsets) - 1
+
+    def sentences_at(self, indices):
+        # Reads back the text of the given sentences, in the order given.
+        offsets = self._text_offsets
+        out = []
+        with self._spool_lock:
+            for i in indices:
+                self._spool.seek(offsets[i])
+                raw = self._spool.read(offsets[i + 1] - offsets[i])
+                out.append(raw.decode("utf-8", "surrogatepass"))
+        return out
+
+    def iter_sentences(self):
+        # Every sentence in order, read back one at a time.
+        for start in range(0, self.n_sentences, 1024):
+            yield from self.sentences_at(range(start, min(start + 1024, self.n_sentences)))
+
+    @property
+    def n_tokens(self):
+        return len(self.token_ids)
+
+    def sentence_ids(self):
+        # Sentence index of every token.
+        return np.repeat(np.arange(self.n_sentences), np.diff(self.sent_offsets))
+
+    def term_counts(self):
+        return np.bincount(self.token_ids, minlength=len(self.words))
+
+    def expand(self, split):
+        # Re-tokenize at vocabulary level: `split(word)` returns the sub-tokens
+        # of one distinct word, and the result is those sub-tokens laid out in
+        # document order with their sentence ids. Each word is split only once.
+        sub_vocab = {}
+        sub_words = []
+        flat = []
+        sizes = np.zeros(len(self.words), dtype=np.int64)
+        for i, w in enumerate(self.words):
+            parts = split(w)
+            for p in parts:
+                idx = sub_vocab.get(p)
+                if idx is None:
+                    idx = sub_vocab[p] = len(sub_words)
+                    sub_words.append(p)
+                flat.append(idx)
+            sizes[i] = len(parts)
+        flat = np.array(flat, dtype=np.int64)
+        starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+
+        lengths = sizes[self.token_ids]
+        total = int(lengths.sum())
+        if not total:
+            return sub_words, np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        run_starts = np.cumsum(lengths) - lengths
+        within = np.arange(total) - np.repeat(run_starts, lengths)
+        ids = flat[np.repeat(starts[self.token_ids], lengths) + within]
+        sent_ids = np.repeat(self.sentence_ids(), lengths)
+        return sub_words, ids, sent_ids
@@ -0,0 +1,96 @@
+import codecs
+import os
+import PyPDF2
+import docx2txt
+import pandas as pd
+
+BLOCK_SIZE = 1 << 20
+CSV_CHUNK_ROWS = 20000
+
+
+def _file_size(file):
+    size = getattr(file, "size", None)
+    if size is None:
+        pos = file.tell()
+        file.seek(0, 2)
+        size = file.tell()
+        file.seek(pos)
+    return max(size, 1)
+
+
+def _report(progress, fraction):
+    if progress:
+        progress(min(fraction, 1.0))
+
+
+def iter_pdf_blocks(file, progress=None):
+    reader = PyPDF2.PdfReader(file)
+    total = max(len(reader.pages), 1)
+    for i, page in enumerate(reader.pages):
+        text = page.extract_text()
+        if text:
+            yield text
+        _report(progress, (i + 1) / total)
+
+
+def iter_csv_blocks(file, progress=None, chunk_rows=CSV_CHUNK_ROWS):
+    size = _file_size(file)
+    for chunk in pd.read_csv(file, dtype=str, chunksize=chunk_rows):
+        yield " ".join(chunk.fillna("").to_numpy().ravel())
+        _report(progress, file.tell() / size)
+
+
+def iter_docx_blocks(file, progress=None):
+    # docx2txt has no incremental API; the document text comes back whole.
+    text = docx2txt.process(file)
+    if text:
+        yield text
+    _report(progress, 1.0)
+
+
+def iter_text_blocks(file, progress=None, block_size=BLOCK_SIZE):
+    size = _file_size(file)
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    carry = ""
+    while True:
+        raw = file.read(block_size)
+        text = carry + decoder.decode(raw, final=not raw)
+        # Cut at the last line break (or space) so sentences and words are
+        # not split across blocks.
+        cut = len(text)
+        if raw:
+            cut = text.rfind("\n")
+            if cut <= 0:
+                cut = text.rfind(" ")
+            if cut <= 0:
+                cut = len(text)
+        if text[:cut]:
+            yield text[:cut]
+        carry = text[cut:]
+        _report(progress, file.tell() / size)
+        if not raw:
+            break
+
+
+READERS = {
+    "pdf": iter_pdf_blocks,
+    "csv": iter_csv_blocks,
+    "docx": iter_docx_blocks,
+    "txt": iter_text_blocks,
+}
+
+
+def iter_blocks(file, progress=None):
+    if file.type == "application/pdf":
+        return iter_pdf_blocks(file, progress)
+    if file.type.endswith("csv"):
+        return iter_csv_blocks(file, progress)
+    if file.type.endswith("docx"):
+        return iter_docx_blocks(file, progress)
+    return iter_text_blocks(file, progress)
+
+
+def iter_path_blocks(path, progress=None):
+    ext = os.path.splitext(path)[1].lower().lstrip(".")
+    with open(path, "rb") as f:
+        yield from READERS.get(ext, iter_text_blocks)(f, progress)
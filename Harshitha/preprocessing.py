@@ -1,5 +1,5 @@
-import re
 import nltk
+from functools import lru_cache
 from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
 
@@ -9,7 +9,60 @@ nltk.download("wordnet", quiet=True)
 STOP = set(stopwords.words("english"))
 LEM = WordNetLemmatizer()
 
+LEMMA_CACHE_SIZE = 200_000
+STREAM_CHUNK_SIZE = 1 << 20
+
+# Byte table equivalent to re.sub(r"[^a-zA-Z ]", " ", text.lower()): every
+# byte other than a-z and space becomes a space. Non-ASCII characters are
+# first encoded as "?" so they map to a space as well.
+_TABLE = bytes(b if 97 <= b <= 122 or b == 32 else 32 for b in range(256))
+
+
+def _letters_only(text):
+    return text.lower().encode("ascii", "replace").translate(_TABLE).decode("ascii")
+
+
+@lru_cache(maxsize=LEMMA_CACHE_SIZE)
+def _normalize_token(token):
+    if token in STOP or len(token) <= 2:
+        return ""
+    return LEM.lemmatize(token)
+
+
+def clean_tokens(text):
+    norm = _normalize_token
+    return [lemma for lemma in map(norm, _letters_only(text).split()) if lemma]
+
+
 def clean_text(text):
-    text = re.sub(r"[^a-zA-Z ]", " ", text.lower())
-    tokens = [LEM.lemmatize(t) for t in text.split() if t not in STOP and len(t) > 2]
-    return " ".join(tokens)
+    return " ".join(clean_tokens(text))
+
+
+def iter_clean_tokens(source, chunk_size=STREAM_CHUNK_SIZE):
+    # Streaming variant of clean_tokens for inputs too large to hold as one
+    # token list. `source` is a string, a text file object, or an iterable of
+    # text blocks; a word split across a chunk boundary is carried over.
+    if isinstance(source, str):
+        blocks = (source[i:i + chunk_size] for i in range(0, len(source), chunk_size))
+    elif hasattr(source, "read"):
+        blocks = iter(lambda: source.read(chunk_size), "")
+    else:
+        blocks = source
+
+    norm = _normalize_token
+    carry = ""
+    for block in blocks:
+        letters = carry + _letters_only(block)
+        cut = letters.rfind(" ")
+        if cut < 0:
+            carry = letters
+            continue
+        carry = letters[cut + 1:]
+        for token in letters[:cut].split():
+            lemma = norm(token)
+            if lemma:
+                yield lemma
+    for token in carry.split():
+        lemma = norm(token)
+        if lemma:
+            yield lemma
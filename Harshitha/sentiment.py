@@ -0,0 +1,177 @@
+import re
+import numpy as np
+from textblob.en import sentiment as _pattern
+from textblob._text import EMOTICONS, PUNCTUATION
+
+# Vectorized re-implementation of TextBlob's PatternAnalyzer for a whole
+# document at once. Each distinct word of the shared TokenizedDocument is
+# split with TextBlob's own tokenizer once, tokens are mapped to lexicon
+# polarity/intensity arrays, and every sentence polarity comes out of one
+# np.bincount segment reduction.
+#
+# PatternAnalyzer walks each sentence keeping a pending modifier and a
+# pending negation. Here each of those states is "the last token that set
+# it, with no reset since", found for every token at once with
+# np.maximum.accumulate. Modelled like TextBlob: modifier chains ("very
+# very rude"), modifiers and negations carried across short words ("really
+# is a good", "not a good"), negation before a modifier ("not very good"),
+# an "-ly" modifier before a negation ("really not good"), "!" boosting the
+# latest assessment, emoticons and "(!)".
+#
+# Tolerance against TextBlob(s).sentiment.polarity, measured by
+# bench_sentiment.py on 50 REAL_SENTENCES (ordinary sentences with
+# contractions, hyphenated words, capitals, emoticons, modifier chains and
+# negations) and on 100k generated sentences:
+#   - real sentences: identical polarity, 100% label agreement
+#   - generated: mean absolute polarity difference 0.0002, 100% labels
+# Not modelled: a known word right after an emoticon that followed a
+# modifier (TextBlob folds it into the emoticon), a "!" between a modifier
+# and the word it modifies, lower-case emoticons such as ":d", which
+# TextBlob does not recognise but a lower-cased document cannot tell
+# apart, and tokenizer rules that look across words (quotes balanced over
+# a sentence, abbreviations split at sentence ends).
+
+POSITIVE_THRESHOLD = 0.05
+NEGATIVE_THRESHOLD = -0.05
+
+WORD_RE = re.compile(r"[a-z]+")
+
+_lexicon = None
+_emoticons = None
+
+
+def _load_lexicon():
+    global _lexicon, _emoticons
+    if _lexicon is None:
+        if not dict.__len__(_pattern):
+            _pattern.load()
+        _emoticons = {e.lower(): p for (_, p), faces in EMOTICONS.items() for e in faces}
+        _lexicon = {
+            w: (tags[None][0], tags[None][2], any(t in tags for t in _pattern.modifiers))
+            for w, tags in dict.items(_pattern)
+        }
+    return _lexicon
+
+
+def _split(word):
+    # TextBlob's tokenizer, skipped for plain words it would leave as they
+    # are. Words arrive lower-cased, which the tokenizer's emoticon pattern
+    # does not expect, so whole emoticons are recognised first.
+    if WORD_RE.fullmatch(word) or word in _emoticons:
+        return [word]
+    return " ".join(_pattern.tokenizer(word)).split()
+
+
+def _prev(mask, size):
+    # Index of the last token before each token where mask holds, or -1.
+    last = np.maximum.accumulate(np.where(mask, np.arange(size), -1))
+    prev = np.full(size, -1)
+    prev[1:] = last[:-1]
+    return prev
+
+
+def sentence_polarities(doc):
+    n = doc.n_sentences
+    if n == 0:
+        return np.zeros(0)
+    lexicon = _load_lexicon()
+    words, ids, sent_ids = doc.expand(_split)
+    if not len(ids):
+        return np.zeros(n)
+
+    entries = [lexicon.get(w) for w in words]
+
+    def per_token(values, dtype=None):
+        return np.array(values, dtype=dtype)[ids]
+
+    known = per_token([e is not None for e in entries], bool)
+    polarity = per_token([e[0] if e else 0.0 for e in entries], float)
+    intensity = per_token([e[1] if e else 1.0 for e in entries], float)
+    modifier = per_token([bool(e and e[2]) for e in entries], bool)
+    negation = per_token([w in _pattern.negations for w in words], bool)
+    ly = per_token([w.endswith("ly") for w in words], bool)
+    long_word = per_token([len(w) > 2 for w in words], bool)
+    keeps_negation = per_token([len(w.strip("'")) <= 1 for w in words], bool)
+    bang = per_token([w == "!" for w in words], bool)
+    sarcasm = per_token([w == "(!)" for w in words], bool)
+    emoticon = per_token([
+        not w.isalpha() and len(w) <= 5 and w not in PUNCTUATION and w in _emoticons for w in words
+    ], bool) & ~known
+    emoticon_polarity = per_token([_emoticons.get(w, 0.0) for w in words], float)
+
+    size = len(ids)
+    pos = np.arange(size)
+    first = np.searchsorted(sent_ids, sent_ids)     # first token of each token's sentence
+
+    # Pending modifier: the last known word, if it is a modifier and no
+    # unknown word longer than two letters came since. After an "-ly"
+    # modifier a negation is folded into the modifier's assessment
+    # ("really not good") instead of clearing it.
+    last_known = _prev(known, size)
+    safe_known = np.maximum(last_known, 0)
+    modifier_before = (last_known >= first) & modifier[safe_known]
+    ly_pending = modifier_before & ly[safe_known] & (_prev(~known & long_word & ~negation, size) < last_known)
+    folded = negation & ~known & ly_pending
+    last_clear = _prev(~known & long_word & ~folded, size)
+    pending_mod = modifier_before & (last_clear < last_known)
+
+    # Pending negation: the last negation word (not folded), with no known
+    # word or longer unknown word since.
+    setter = negation & ~folded
+    clearer = (known & ~negation) | (~known & ~negation & ~keeps_negation) | folded
+    last_set = _prev(setter, size)
+    negated = known & (last_set >= first) & (_prev(clearer, size) < last_set)
+
+    # Assessments: each known word either joins the assessment of the
+    # pending modifier ("very good") or starts a new one.
+    joins = known & pending_mod
+    head = np.maximum.accumulate(np.where(known & ~joins, pos, -1))
+    step = np.where(negated, 1.0 / np.where(intensity == 0, 1.0, intensity), intensity)
+    value = np.where(
+        joins,
+        np.clip(polarity * step[safe_known], -1.0, 1.0),
+        polarity,
+    )
+
+    kn = np.flatnonzero(known)
+    chain = head[kn]
+    is_last = np.append(chain[1:] != chain[:-1], True)
+    chain_value = np.zeros(size)
+    chain_value[chain[is_last]] = value[kn[is_last]]
+    chain_end = np.full(size, -1)
+    chain_end[chain[is_last]] = kn[is_last]
+    flipped = np.zeros(size, dtype=bool)
+    flipped[chain[negated[kn]]] = True
+    flipped[head[safe_known[folded]]] = True
+
+    # Entries averaged per sentence: assessments, emoticons and "(!)".
+    starts = known & ~joins
+    entry = starts | emoticon | sarcasm
+    entry_value = np.where(starts, chain_value, np.where(emoticon, emoticon_polarity, 0.0))
+
+    # "!" boosts the latest entry, unless its assessment goes on past the "!".
+    target = _prev(entry, size)
+    hits = bang & (target >= first)
+    target = target[hits]
+    live = ~starts[target] | (chain_end[target] < pos[hits])
+    boosts = np.bincount(target[live], minlength=size)
+    entry_value = np.clip(entry_value * 1.25 ** boosts, -1.0, 1.0)
+    entry_value = np.where(starts & flipped, entry_value * -0.5, entry_value)
+
+    weights = entry.astype(float)
+    totals = np.bincount(sent_ids, weights=entry_value * weights, minlength=n)
+    counts = np.bincount(sent_ids, weights=weights, minlength=n)
+    return totals / np.maximum(counts, 1)
+
+
+def score_sentences(doc):
+    polarities = sentence_polarities(doc)
+    positive = polarities > POSITIVE_THRESHOLD
+    negative = polarities < NEGATIVE_THRESHOLD
+    labels = np.where(positive, "Positive", np.where(negative, "Negative", "Neutral")).tolist()
+    buckets = {
+        "Positive": polarities[positive].tolist(),
+        "Neutral": polarities[~positive & ~negative].tolist(),
+        "Negative": polarities[negative].tolist(),
+    }
+    return labels, buckets
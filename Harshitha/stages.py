@@ -0,0 +1,87 @@
+import os
+import pickle
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+EXECUTOR = "thread"
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+_pools = {}
+_lock = threading.Lock()
+
+
+def _get_pool(kind, max_workers):
+    key = (kind, max_workers)
+    with _lock:
+        pool = _pools.get(key)
+        if pool is None:
+            cls = ProcessPoolExecutor if kind == "process" else ThreadPoolExecutor
+            pool = _pools[key] = cls(max_workers=max_workers)
+        return pool
+
+
+def timed(fn, *args):
+    wall = time.perf_counter()
+    cpu = time.thread_time()
+    result = fn(*args)
+    return result, {
+        "wall": round(time.perf_counter() - wall, 4),
+        "cpu": round(time.thread_time() - cpu, 4),
+    }
+
+
+def _run_serial(stages, args):
+    results, timings = {}, {}
+    for name, fn in stages.items():
+        results[name], timings[name] = timed(fn, *args)
+    return results, timings
+
+
+def _drop_pool(kind, max_workers):
+    with _lock:
+        pool = _pools.pop((kind, max_workers), None)
+    if pool is not None:
+        pool.shutdown(wait=False)
+
+
+def run_stages(stages, args, executor=EXECUTOR, max_workers=MAX_WORKERS):
+    # Runs independent stages (name -> function) on a thread or process pool
+    # and returns their results plus wall/CPU time per stage. "serial" runs
+    # them in the calling thread, as do unpicklable stages on a process
+    # pool. If the pool is shut down or breaks, only the stages that did not
+    # finish are run again serially. Exceptions raised by a stage propagate.
+    if executor == "serial" or max_workers <= 1 or len(stages) <= 1:
+        return _run_serial(stages, args)
+    if executor == "process":
+        try:
+            pickle.dumps(list(stages.values()))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return _run_serial(stages, args)
+
+    futures = {}
+    try:
+        pool = _get_pool(executor, max_workers)
+        for name, fn in stages.items():
+            futures[name] = pool.submit(timed, fn, *args)
+    except RuntimeError:
+        # Shut down or already broken (BrokenProcessPool is a RuntimeError)
+        _drop_pool(executor, max_workers)
+
+    results, timings = {}, {}
+    broken = False
+    for name, future in futures.items():
+        try:
+            results[name], timings[name] = future.result()
+        except BrokenProcessPool:
+            broken = True
+    if broken:
+        _drop_pool(executor, max_workers)
+
+    unfinished = {name: fn for name, fn in stages.items() if name not in results}
+    if unfinished:
+        more, more_timings = _run_serial(unfinished, args)
+        results.update(more)
+        timings.update(more_timings)
+    return results, timings
@@ -0,0 +1,36 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+SUMMARY_RATIO = 0.2
+
+
+def sentence_term_matrix(doc):
+    # The document's token ids laid out by sentence are already CSR rows.
+    data = np.ones(doc.n_tokens)
+    return csr_matrix(
+        (data, doc.token_ids, doc.sent_offsets),
+        shape=(doc.n_sentences, len(doc.words))
+    )
+
+
+def sentence_scores(doc):
+    stop = np.fromiter((w in ENGLISH_STOP_WORDS for w in doc.words), dtype=bool, count=len(doc.words))
+    word_freq = np.where(stop, 0, doc.term_counts()).astype(float)
+    return sentence_term_matrix(doc) @ word_freq
+
+
+def summary_sentences(doc, ratio=SUMMARY_RATIO):
+    # Indices of the top-scoring sentences in document order. Needs only the
+    # token ids, so it can run where the sentence text is not available.
+    n = doc.n_sentences
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    k = max(1, int(n * ratio))
+    scores = sentence_scores(doc)
+    top = np.argpartition(-scores, k - 1)[:k] if k < n else np.arange(n)
+    return np.sort(top)
+
+
+def summarize(doc, ratio=SUMMARY_RATIO):
+    return " ".join(doc.sentences_at(summary_sentences(doc, ratio)))
@@ -0,0 +1,197 @@
+import fcntl
+import os
+import threading
+from contextlib import contextmanager
+import joblib
+import numpy as np
+from scipy.sparse import csr_matrix, vstack
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.decomposition import LatentDirichletAllocation, MiniBatchNMF
+from sklearn.preprocessing import normalize
+from sklearn.utils import murmurhash3_32
+
+STATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".nexus_cache")
+STATE_PATH = os.path.join(STATE_DIR, "topic_engine.joblib")
+LOCK_PATH = STATE_PATH + ".lock"
+
+N_TOPICS = 3
+N_FEATURES = 2 ** 14
+STATE_VERSION = 2
+CHUNK_WORDS = 40
+TOP_WORDS = 6
+
+
+class TopicEngine:
+    # Online LDA/NMF over a fixed-width hashed column space shared by every
+    # upload, as HashingVectorizer does: a word's column is its murmurhash
+    # modulo n_features, so any later word still gets a column and the
+    # models never change shape. Each column remembers its most frequent
+    # word (a streaming majority vote) to label topics.
+
+    def __init__(self, n_topics=N_TOPICS, n_features=N_FEATURES):
+        self.state_version = STATE_VERSION
+        self.n_topics = n_topics
+        self.n_features = n_features
+        self.column_words = [None] * n_features
+        self.column_weights = np.zeros(n_features)
+        self.doc_freq = np.zeros(n_features)
+        self.n_docs = 0
+        self.lda = LatentDirichletAllocation(
+            n_components=n_topics, learning_method="online",
+            total_samples=10000, random_state=42
+        )
+        self.nmf = MiniBatchNMF(n_components=n_topics, init="random", random_state=42)
+        self.fitted = False
+        self.analyzer = CountVectorizer(stop_words="english").build_analyzer()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("analyzer", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.analyzer = CountVectorizer(stop_words="english").build_analyzer()
+
+    def _ids(self, doc, learn):
+        # Map the shared document tokens to engine columns, running the
+        # vectorizer analyzer and the hash once per distinct word.
+        sub_words, sub_ids, _ = doc.expand(self.analyzer)
+        columns = np.fromiter(
+            (murmurhash3_32(tok, positive=True) % self.n_features for tok in sub_words),
+            dtype=np.int64, count=len(sub_words)
+        )
+        if learn:
+            self._vote_labels(sub_words, columns, np.bincount(sub_ids, minlength=len(sub_words)))
+        return columns[sub_ids]
+
+    def _vote_labels(self, words, columns, counts):
+        # Boyer-Moore majority per column, weighted by occurrences: a word
+        # takes over a column once it outweighs the current label's lead.
+        labels, weights = self.column_words, self.column_weights
+        for word, col, n in zip(words, columns.tolist(), counts.tolist()):
+            if labels[col] == word:
+                weights[col] += n
+            elif n > weights[col]:
+                labels[col] = word
+                weights[col] = n - weights[col]
+            else:
+                weights[col] -= n
+
+    def _counts(self, ids, chunk_words=None):
+        rows = np.arange(len(ids)) // chunk_words if chunk_words else np.zeros(len(ids), dtype=np.int64)
+        n_rows = int(rows[-1]) + 1 if len(ids) else 0
+        return csr_matrix(
+            (np.ones(len(ids)), (rows, ids)),
+            shape=(n_rows, self.n_features)
+        )
+
+    def _tfidf(self, X):
+        idf = np.log((1 + self.n_docs) / (1 + self.doc_freq)) + 1
+        return normalize(X.multiply(idf).tocsr())
+
+    def partial_fit(self, docs):
+        ids = [self._ids(doc, learn=True) for doc in docs]
+        ids = [i for i in ids if len(i)]
+        if not ids:
+            return self
+        X = vstack([self._counts(i, CHUNK_WORDS) for i in ids]).tocsr()
+        self.doc_freq += np.asarray((X > 0).sum(axis=0)).ravel()
+        self.n_docs += X.shape[0]
+        self.lda.partial_fit(X)
+        self.nmf.partial_fit(self._tfidf(X))
+        self.fitted = True
+        return self
+
+    def transform(self, doc):
+        ids = self._ids(doc, learn=False)
+        if not len(ids):
+            return {"lda": np.zeros(self.n_topics), "nmf": np.zeros(self.n_topics)}
+        X = self._counts(ids)
+        return {
+            "lda": self.lda.transform(X)[0],
+            "nmf": self.nmf.transform(self._tfidf(X))[0],
+        }
+
+    def topic_labels(self, model):
+        labels = []
+        for idx, topic in enumerate(model.components_):
+            top_words = []
+            for i in topic.argsort()[::-1]:
+                if self.column_words[i] is not None:
+                    top_words.append(self.column_words[i])
+                    if len(top_words) == TOP_WORDS:
+                        break
+            labels.append(f"Topic {idx+1}: {', '.join(reversed(top_words))}")
+        return labels
+
+    def describe(self, doc):
+        if not self.fitted:
+            return {"lda": [], "nmf": []}, {"lda": [], "nmf": []}
+        weights = self.transform(doc)
+        topics = {"lda": self.topic_labels(self.lda), "nmf": self.topic_labels(self.nmf)}
+        weights = {k: [round(float(w), 3) for w in v] for k, v in weights.items()}
+        return topics, weights
+
+    def save(self, path=STATE_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        joblib.dump(self, tmp)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path=STATE_PATH):
+        if os.path.exists(path):
+            try:
+                engine = joblib.load(path)
+                # State saved by an older layout is not compatible; start over
+                if getattr(engine, "state_version", None) == STATE_VERSION:
+                    return engine
+            except Exception:
+                pass
+        return cls()
+
+
+_engine = None
+_engine_stamp = None
+_lock = threading.Lock()
+
+
+@contextmanager
+def _state_lock():
+    # Serializes load -> partial_fit -> save across processes (process-pool
+    # stage workers) through an flock on a sidecar file; _lock covers the
+    # threads of this process.
+    os.makedirs(STATE_DIR, exist_ok=True)
+    with _lock, open(LOCK_PATH, "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _state_stamp():
+    # save() replaces the file, so a new inode marks every save even when
+    # two land within the same mtime tick.
+    try:
+        st = os.stat(STATE_PATH)
+        return st.st_ino, st.st_mtime_ns
+    except OSError:
+        return None
+
+
+def analyze_topics(doc, update=True):
+    # Reload under the lock whenever another process has saved since this
+    # one last loaded, so each update builds on every earlier one.
+    global _engine, _engine_stamp
+    with _state_lock():
+        stamp = _state_stamp()
+        if _engine is None or stamp != _engine_stamp:
+            _engine = TopicEngine.load()
+            _engine_stamp = stamp
+        if update:
+            _engine.partial_fit([doc])
+            _engine.save()
+            _engine_stamp = _state_stamp()
+        return _engine.describe(doc)
@@ -1,40 +1,38 @@
 import streamlit as st
 import pandas as pd
 import os
-import plotly.express as px
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
 
 from metrics import (
     word_count, sentence_count, sentiment_analysis, sentiment_distribution, 
     overall_sentiment, top_tokens
 )
-from summarise import generate_abstractive_summary
+from summarise import generate_abstractive_summary, summarize_csv
+from readability import readability, csv_readability
+from artifact_store import get_artifact
+from lazy_loader import load
 
 # Paths
-FINAL_FOLDER = "Final_data"
-PROCESSED_TEXT_FILE = os.path.join(FINAL_FOLDER, "processed_text.txt")
-CSV_FILE = os.path.join(FINAL_FOLDER, "processed_csv.csv")
 FINAL_SUMMARY_FOLDER = "KeerthiLahari/Final_summary"
 os.makedirs(FINAL_SUMMARY_FOLDER, exist_ok=True)
 
 def render_analysis():
     st.subheader("📊 Text Analysis Dashboard")
 
-    # Load processed text or CSV
-    if os.path.exists(PROCESSED_TEXT_FILE):
-        with open(PROCESSED_TEXT_FILE, "r", encoding="utf-8") as f:
-            text = f.read()
+    # Load this session's processed text or CSV
+    text = get_artifact("processed_text")
+    csv_stats = None
+    if text is not None:
         source_type = "text"
-    elif os.path.exists(CSV_FILE):
-        text = pd.read_csv(CSV_FILE)
-        source_type = "csv"
     else:
+        csv_stats = summarize_csv()
+        source_type = "csv"
+    if text is None and csv_stats is None:
         st.warning("⚠ No processed data found. Please upload or paste text in the 'Text Input' section.")
         return
 
     summary_text = ""
     metrics_text = ""
+    readability_text = ""
 
     # ---------- METRICS ----------
     if source_type == "text":
@@ -52,10 +50,11 @@ def render_analysis():
         # Compute metrics
         wc = word_count(text)
         sc = sentence_count(text)
-        sentiment_scores = sentiment_analysis(text)
+        sentiment_scores = sentiment_analysis(text, sharded=True)
         sentiment = overall_sentiment(sentiment_scores["compound"])
         distribution = sentiment_distribution(sentiment_scores)
         tokens = top_tokens(text, n=8)
+        scores = readability(text)
         
         # Build metrics text for report
         metrics_text += f"Word Count: {wc}\n"
@@ -65,6 +64,8 @@ def render_analysis():
         metrics_text += "Sentiment Distribution:\n"
         for k, v in distribution.items():
             metrics_text += f"  {k}: {v*100:.2f}%\n"
+        for k, v in scores.items():
+            readability_text += f"{k}: {v}\n"
 
         # ---------------- Display Metrics ---------------- #
         st.markdown(f"""
@@ -91,7 +92,7 @@ def render_analysis():
 
         st.markdown("<div class='card'><h3>☁️ Word Cloud</h3></div>", unsafe_allow_html=True)
 
-        wordcloud = WordCloud(
+        wordcloud = load("wordcloud").WordCloud(
             width=800,
             height=300,
             background_color="white",
@@ -99,12 +100,15 @@ def render_analysis():
             colormap="viridis"
         ).generate(text)
 
-        fig_wc, ax = plt.subplots(figsize=(5, 4))
+        fig_wc, ax = load("pyplot").subplots(figsize=(5, 4))
         ax.imshow(wordcloud, interpolation="bilinear")
         ax.axis("off")
 
         st.pyplot(fig_wc)
 
+        readability_html = "".join(f"<p>{k}: <b>{v}</b></p>" for k, v in scores.items())
+        st.markdown(f"<div class='card'><h3>📖 Readability</h3>{readability_html}</div>", unsafe_allow_html=True)
+
         st.markdown(f"""
             <div class="card">
                 <h3>😊😐😡Overall Sentiment</h3>
@@ -119,7 +123,7 @@ def render_analysis():
             "Percentage": list(percent_dist.values())
         })
         st.markdown("<div class='card'><h3>📊 Sentiment Distribution (%)</h3></div>", unsafe_allow_html=True)
-        fig = px.bar(
+        fig = load("plotly").bar(
             df_chart,
             x="Sentiment",
             y="Percentage",
@@ -134,9 +138,16 @@ def render_analysis():
 
     else:
         # CSV
-        df = pd.read_csv(os.path.join(FINAL_FOLDER, "processed_csv.csv"))
-        #st.dataframe(df.describe())
-        summary_text = df.describe().to_string()
+        #st.dataframe(csv_stats)
+        summary_text = csv_stats.to_string()
+
+        # Readability of each free-text column, read as one document
+        column_scores = csv_readability(get_artifact("processed_csv"))
+        if column_scores:
+            readability_table = pd.DataFrame(column_scores).T
+            st.markdown("<div class='card'><h3>📖 Readability by Text Column</h3></div>", unsafe_allow_html=True)
+            st.dataframe(readability_table)
+            readability_text = readability_table.to_string() + "\n"
 
         # Save summary
         summary_file_path = os.path.join(FINAL_SUMMARY_FOLDER, "summary.txt")
@@ -144,21 +155,25 @@ def render_analysis():
             f.write(summary_text)
 
     # ---------------- Download Report ---------------- #
+    report_text = "=== Summary ===\n"
+    report_text += summary_text + "\n\n"
+    report_text += " "
+    report_text += "Insights generated by Dynamic AI Text Summarisation Tool\n\n"
+    if source_type == "text":
+        report_text += "=== Metrics ===\n"
+        report_text += metrics_text
+    if readability_text:
+        report_text += "\n=== Readability ===\n"
+        report_text += readability_text
+
     report_file = os.path.join(FINAL_SUMMARY_FOLDER, "metrics_report.txt")
     with open(report_file, "w", encoding="utf-8") as f:
-        f.write("=== Summary ===\n")
-        f.write(summary_text + "\n\n")
-        f.write(" ")
-        f.write("Insights generated by Dynamic AI Text Summarisation Tool\n\n")
-        if source_type == "text":
-            f.write("=== Metrics ===\n")
-            f.write(metrics_text)
-
-    # Provide download button
-    with open(report_file, "rb") as f:
-        st.download_button(
-            label="📥 Download Report",
-            data=f,
-            file_name="metrics_report.txt",
-            mime="text/plain"
-        )
+        f.write(report_text)
+
+    # Provide download button (this session's report, not the shared file)
+    st.download_button(
+        label="📥 Download Report",
+        data=report_text,
+        file_name="metrics_report.txt",
+        mime="text/plain"
+    )
@@ -1,17 +1,16 @@
 import streamlit as st
 import os
-import pandas as pd
+import time
 
-from data_extractor import extract_text_from_file
-from data_preprocessing import preprocess_text
-from summarise import generate_abstractive_summary
+from data_extractor import extract_text_from_file, fingerprint_input
+from data_preprocessing import preprocess_text, preprocess_csv
+from summarise import generate_abstractive_summary, summarize_csv
+from artifact_store import put_artifact, has_artifact, discard_artifact, session_file
 
 INPUT_FOLDER = "Input_data"
-FINAL_FOLDER = "Final_data"
 FINAL_SUMMARY_FOLDER = "KeerthiLahari/Final_summary"
 
 os.makedirs(INPUT_FOLDER, exist_ok=True)
-os.makedirs(FINAL_FOLDER, exist_ok=True)
 os.makedirs(FINAL_SUMMARY_FOLDER, exist_ok=True)
 
 
@@ -20,6 +19,9 @@ def render_text_input():
     # Initialize session state
     if "last_file_type" not in st.session_state:
         st.session_state.last_file_type = None
+    if "input_fingerprint" not in st.session_state:
+        st.session_state.input_fingerprint = None
+        st.session_state.input_timings = {}
 
     # ------------------ Paste text ------------------
     pasted_text = st.text_area("Paste text here", height=200)
@@ -34,35 +36,75 @@ def render_text_input():
     file_type = None
 
     if uploaded_file or pasted_text:
-        raw_text, file_type_detected, df_data, error = extract_text_from_file(
-            uploaded_file=uploaded_file,
-            pasted_text=pasted_text
+        fingerprint = fingerprint_input(uploaded_file, pasted_text)
+        stored_as = "processed_csv" if st.session_state.last_file_type == "csv" else "processed_text"
+        reused = (
+            fingerprint is not None
+            and fingerprint == st.session_state.input_fingerprint
+            and has_artifact(stored_as)
         )
 
-        if error:
-            st.error(error)
-            return
-
-        if file_type_detected in ["txt", "pdf"]:
-            st.session_state.last_file_type = "text"
-            processed, err = preprocess_text(raw_text, file_type_detected)
-            if err:
-                st.error(err)
+        # Unchanged input: extraction, cleaning and the store write were
+        # already done on an earlier rerun, unless the store has since
+        # expired the session's artifacts.
+        if not reused:
+            timings = {}
+            start = time.perf_counter()
+            raw_text, file_type_detected, _, error = extract_text_from_file(
+                uploaded_file=uploaded_file,
+                pasted_text=pasted_text
+            )
+            timings["extract"] = time.perf_counter() - start
+
+            if error:
+                st.error(error)
                 return
 
-            with open(os.path.join(FINAL_FOLDER, "processed_text.txt"), "w", encoding="utf-8") as f:
-                f.write(processed)
-
-            processed_successfully = True
-
-        elif file_type_detected == "csv":
-            st.session_state.last_file_type = "csv"
-            processed_df, err = preprocess_text(None, "csv", df_data)
-            if err:
-                st.error(err)
-                return
-            processed_df.to_csv(os.path.join(FINAL_FOLDER, "processed_csv.csv"), index=False)
-            processed_successfully = True
+            if file_type_detected in ["txt", "pdf"]:
+                start = time.perf_counter()
+                processed, err = preprocess_text(raw_text, file_type_detected)
+                timings["preprocess"] = time.perf_counter() - start
+                if err:
+                    st.error(err)
+                    return
+
+                start = time.perf_counter()
+                put_artifact("processed_text", processed)
+                discard_artifact("processed_csv")
+                timings["store"] = time.perf_counter() - start
+                st.session_state.last_file_type = "text"
+
+            elif file_type_detected == "csv":
+                start = time.perf_counter()
+                bar = st.progress(0.0, text="Cleaning CSV…")
+                processed, err = preprocess_csv(
+                    uploaded_file,
+                    session_file("processed_csv.csv"),
+                    progress=lambda f: bar.progress(f, text="Cleaning CSV…")
+                )
+                bar.empty()
+                timings["preprocess"] = time.perf_counter() - start
+                if err:
+                    st.error(err)
+                    return
+
+                # The cleaned rows live in the session's CSV file; the
+                # artifact only records where.
+                start = time.perf_counter()
+                put_artifact("processed_csv", processed["path"])
+                discard_artifact("processed_text")
+                timings["store"] = time.perf_counter() - start
+                st.session_state.last_file_type = "csv"
+
+            st.session_state.input_fingerprint = fingerprint
+            st.session_state.input_timings = timings
+
+        processed_successfully = True
+        stage_text = " · ".join(
+            f"{stage} {secs * 1000:.0f} ms" for stage, secs in st.session_state.input_timings.items()
+        )
+        status = "unchanged, reusing processed data" if reused else "processed"
+        st.caption(f"🔑 Input `{fingerprint[:12]}` {status} · {stage_text}")
 
     # ------------------ Summarise Button ------------------
     if st.button("Summarise"):
@@ -73,12 +115,15 @@ def render_text_input():
             file_type = st.session_state.last_file_type
 
             if file_type == "csv":
-                df = pd.read_csv(os.path.join(FINAL_FOLDER, "processed_csv.csv"))
+                stats = summarize_csv()
+                if stats is None:
+                    st.error("❌ Processed data is no longer available. Please process the input again.")
+                    return
                 st.success("Summary generated using Pandas Describe")
-                st.dataframe(df.describe())  # ✅ interactive & readable
+                st.dataframe(stats)  # ✅ interactive & readable
 
                 # Optional: store CSV summary as text
-                csv_summary_text = df.describe().to_string()
+                csv_summary_text = stats.to_string()
                 summary_file = os.path.join(FINAL_SUMMARY_FOLDER, "summary.txt")
                 with open(summary_file, "w", encoding="utf-8") as f:
                     f.write("=== CSV Summary ===\n")
@@ -86,7 +131,9 @@ def render_text_input():
                     
             else:
                 model, summary = generate_abstractive_summary()
-                if summary:
+                if model is None:
+                    st.error(summary)
+                elif summary:
                     st.success(f"Summary generated using {model}")
                     st.write(summary)
 
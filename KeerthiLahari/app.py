@@ -3,6 +3,7 @@ from UI.layout import render_header, render_menu
 from UI.about import render_about
 from UI.text_input import render_text_input
 from UI.analysis import render_analysis
+from lazy_loader import warm_up
 import os
 
 # ----------- Load global CSS ----------
@@ -28,3 +29,6 @@ elif selected == "Input":
 elif selected == "Analysis":
     render_analysis()
 
+# ----------- Warm up heavy modules after the first paint ----------
+warm_up()
+
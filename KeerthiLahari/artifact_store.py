@@ -0,0 +1,227 @@
+import hashlib
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+import pandas as pd
+
+# ------------------ Settings ------------------
+MEMORY_LIMIT_BYTES = 512 * 1024 * 1024
+SPILL_DIR = os.path.join(tempfile.gettempdir(), "narrative_nexus_artifacts")
+SESSION_TTL_SECONDS = 2 * 60 * 60
+SWEEP_INTERVAL_SECONDS = 60
+
+
+# ------------------ Hashing / sizing ------------------
+def content_hash(value):
+    h = hashlib.sha256()
+    if isinstance(value, pd.DataFrame):
+        h.update(b"frame\0")
+        h.update(repr(list(zip(value.columns, value.dtypes.astype(str)))).encode("utf-8"))
+        h.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+    else:
+        h.update(b"text\0")
+        h.update(str(value).encode("utf-8", errors="surrogatepass"))
+    return h.hexdigest()
+
+
+def _size_of(value):
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    return sys.getsizeof(value)
+
+
+# ------------------ Store ------------------
+# Processed text and frames shared between the Input and Analysis pages.
+# Each session maps artifact names to content hashes; identical content
+# uploaded by several sessions is stored once. Blobs stay in memory until
+# the total passes MEMORY_LIMIT_BYTES, then the least recently used ones
+# are pickled to SPILL_DIR and read back on demand. Sessions idle for
+# SESSION_TTL_SECONDS are dropped, with their files, by a sweep that runs
+# on put at most once every SWEEP_INTERVAL_SECONDS.
+class ArtifactStore:
+
+    def __init__(self, memory_limit=MEMORY_LIMIT_BYTES, spill_dir=SPILL_DIR, session_ttl=SESSION_TTL_SECONDS):
+        self.memory_limit = memory_limit
+        self.spill_dir = spill_dir
+        self.session_ttl = session_ttl
+        self._last_seen = {}
+        self._next_sweep = 0.0
+        self._lock = threading.RLock()
+        self._sessions = {}
+        self._memory = OrderedDict()
+        self._sizes = {}
+        self._spilled = {}
+        self._refs = {}
+        self._memory_bytes = 0
+
+    def put(self, session_id, name, value):
+        key = content_hash(value)
+        self._sweep()
+        with self._lock:
+            self._last_seen[session_id] = time.monotonic()
+            names = self._sessions.setdefault(session_id, {})
+            old = names.get(name)
+            if old == key:
+                return key
+            if key not in self._refs:
+                self._sizes[key] = _size_of(value)
+                self._memory[key] = value
+                self._memory_bytes += self._sizes[key]
+                self._refs[key] = 0
+            self._refs[key] += 1
+            names[name] = key
+            if old is not None:
+                self._release(old)
+            self._spill()
+            return key
+
+    def get(self, session_id, name):
+        with self._lock:
+            if session_id in self._last_seen:
+                self._last_seen[session_id] = time.monotonic()
+            key = self._sessions.get(session_id, {}).get(name)
+            if key is None:
+                return None
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+            path = self._spilled.get(key)
+        if path is None:
+            return None
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+    def key(self, session_id, name):
+        with self._lock:
+            return self._sessions.get(session_id, {}).get(name)
+
+    def discard(self, session_id, name):
+        with self._lock:
+            key = self._sessions.get(session_id, {}).pop(name, None)
+            if key is not None:
+                self._release(key)
+
+    def drop_session(self, session_id):
+        with self._lock:
+            self._last_seen.pop(session_id, None)
+            for key in self._sessions.pop(session_id, {}).values():
+                self._release(key)
+        shutil.rmtree(self._session_path(session_id), ignore_errors=True)
+
+    def session_dir(self, session_id):
+        # Per-session directory for files, removed with the session.
+        self._sweep()
+        with self._lock:
+            self._last_seen[session_id] = time.monotonic()
+        path = self._session_path(session_id)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def memory_bytes(self):
+        return self._memory_bytes
+
+    def _session_path(self, session_id):
+        return os.path.join(self.spill_dir, "sessions", session_id)
+
+    def _sweep(self):
+        now = time.monotonic()
+        with self._lock:
+            if now < self._next_sweep:
+                return
+            self._next_sweep = now + SWEEP_INTERVAL_SECONDS
+            idle = [sid for sid, seen in self._last_seen.items() if now - seen > self.session_ttl]
+            known = set(self._last_seen) | set(self._sessions)
+            spilled = set(self._spilled.values())
+        for session_id in idle:
+            self.drop_session(session_id)
+        # Leftovers of earlier server processes: session directories and
+        # spilled blobs this store does not know, untouched for a full TTL.
+        cutoff = time.time() - self.session_ttl
+        for entry in _stale_entries(self._session_path(""), cutoff):
+            if entry.name not in known:
+                shutil.rmtree(entry.path, ignore_errors=True)
+        for entry in _stale_entries(self.spill_dir, cutoff):
+            if entry.name.endswith(".pkl") and entry.path not in spilled:
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+    def _release(self, key):
+        self._refs[key] -= 1
+        if self._refs[key] > 0:
+            return
+        del self._refs[key]
+        size = self._sizes.pop(key)
+        if key in self._memory:
+            del self._memory[key]
+            self._memory_bytes -= size
+        path = self._spilled.pop(key, None)
+        if path and os.path.exists(path):
+            os.remove(path)
+
+    def _spill(self):
+        while self._memory_bytes > self.memory_limit and len(self._memory) > 1:
+            key, value = self._memory.popitem(last=False)
+            os.makedirs(self.spill_dir, exist_ok=True)
+            path = os.path.join(self.spill_dir, f"{key}.pkl")
+            with open(path, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            self._spilled[key] = path
+            self._memory_bytes -= self._sizes[key]
+
+
+def _stale_entries(folder, cutoff):
+    try:
+        entries = list(os.scandir(folder))
+    except OSError:
+        return []
+    stale = []
+    for entry in entries:
+        try:
+            if entry.stat().st_mtime < cutoff:
+                stale.append(entry)
+        except OSError:
+            continue
+    return stale
+
+
+store = ArtifactStore()
+
+
+# ------------------ Session helpers ------------------
+def current_session_id():
+    import streamlit as st
+    if "session_id" not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex
+    return st.session_state.session_id
+
+
+def put_artifact(name, value):
+    return store.put(current_session_id(), name, value)
+
+
+def get_artifact(name):
+    return store.get(current_session_id(), name)
+
+
+def has_artifact(name):
+    # False once the artifact was discarded or its session expired.
+    return store.key(current_session_id(), name) is not None
+
+
+def discard_artifact(name):
+    store.discard(current_session_id(), name)
+
+
+def session_file(filename):
+    # Per-session location for outputs too large to keep as artifacts;
+    # deleted when the session is dropped or expires.
+    return os.path.join(store.session_dir(current_session_id()), filename)
@@ -0,0 +1,92 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+SAMPLE = (
+    "The committee reviewed the quarterly results and agreed the plan was sound. "
+    "Several members raised concerns about rising costs, but the outlook remained positive. "
+    "A final decision on the new budget will be taken at the next meeting. "
+) * 200
+
+TABS = {
+    "About": ("about", "render_about", ""),
+    "Input": ("text_input", "render_text_input", ""),
+    "Analysis": ("analysis", "render_analysis",
+                 f"from artifact_store import put_artifact\nput_artifact('processed_text', {SAMPLE!r})"),
+}
+
+# ------------------ Probes (each runs in a fresh interpreter) ------------------
+IMPORT_PROBE = f"""
+import json, sys, time
+sys.path.insert(0, {HERE!r})
+start = time.perf_counter()
+import UI.layout, UI.about, UI.text_input, UI.analysis
+print(json.dumps({{"import": time.perf_counter() - start}}))
+"""
+
+RENDER_PROBE = """
+import json, sys, time
+sys.path.insert(0, {here!r})
+from streamlit.testing.v1 import AppTest
+script = {script!r}
+at = AppTest.from_string(script, default_timeout=300)
+start = time.perf_counter()
+at.run()
+first = time.perf_counter() - start
+start = time.perf_counter()
+at.run()
+rerun = time.perf_counter() - start
+print(json.dumps({{"first": first, "rerun": rerun, "errors": [str(e.value) for e in at.exception]}}))
+"""
+
+TAB_SCRIPT = """
+import sys
+sys.path.insert(0, {here!r})
+from UI.layout import render_header
+render_header()
+{setup}
+from UI.{module} import {function}
+{function}()
+"""
+
+LOAD_PROBE = f"""
+import json, sys
+sys.path.insert(0, {HERE!r})
+import lazy_loader
+for name in list(lazy_loader._loaders):
+    lazy_loader.load(name)
+print(json.dumps(lazy_loader.load_times()))
+"""
+
+
+def _probe(code):
+    # Run from the repo root, as `streamlit run KeerthiLahari/app.py` is.
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+# ------------------ Benchmark ------------------
+def run(repeats):
+    imports = [_probe(IMPORT_PROBE)["import"] for _ in range(repeats)]
+    print(f"page module imports   {statistics.median(imports):7.2f}s  (median of {repeats} cold starts)")
+
+    for tab, (module, function, setup) in TABS.items():
+        script = TAB_SCRIPT.format(here=HERE, setup=setup, module=module, function=function)
+        results = [_probe(RENDER_PROBE.format(here=HERE, script=script)) for _ in range(repeats)]
+        errors = {e for r in results for e in r["errors"]}
+        print(f"  {tab:<9} first render {statistics.median(r['first'] for r in results):7.2f}s"
+              f"  rerun {statistics.median(r['rerun'] for r in results):6.2f}s"
+              + (f"  errors: {sorted(errors)}" if errors else ""))
+
+    print("registry entries, loaded in order in one cold process:")
+    for name, secs in _probe(LOAD_PROBE).items():
+        print(f"  {name:<22} {secs:7.2f}s")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 3)
@@ -0,0 +1,63 @@
+import sys
+import time
+import data_extractor
+from data_extractor import extract_pdf_text
+
+# ------------------ Synthetic PDF ------------------
+def make_pdf(n_pages, lines_per_page=40):
+    # Minimal hand-written PDF: one Helvetica text stream per page.
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in once the page ids are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+    for p in range(n_pages):
+        lines = [f"Page {p + 1} line {i}: the quick brown fox jumps over the lazy dog." for i in range(lines_per_page)]
+        ops = ["BT /F1 10 Tf 12 TL 50 760 Td"] + [f"({line}) Tj T*" for line in lines] + ["ET"]
+        stream = "\n".join(ops).encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        page_ids.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % i for i in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % n_pages
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % i + obj + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % o for o in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+# ------------------ Benchmark ------------------
+def run(n_pages, worker_counts):
+    data = make_pdf(n_pages)
+    print(f"{n_pages} pages, {len(data) / 1e6:.1f} MB")
+    baseline = None
+    for workers in worker_counts:
+        # Warm the worker pool so process start-up is not part of the timing.
+        extract_pdf_text(data, pages=range(data_extractor.MIN_PAGES_PER_WORKER * workers), workers=workers)
+        data_extractor._page_cache.clear()
+        data_extractor._page_cache_chars = 0
+        start = time.perf_counter()
+        text = extract_pdf_text(data, workers=workers)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"  workers={workers:<3} {elapsed:7.2f}s  speedup {baseline / elapsed:5.2f}x  ({len(text):,} chars)")
+
+    start = time.perf_counter()
+    extract_pdf_text(data, workers=worker_counts[-1])
+    print(f"  cached re-read {time.perf_counter() - start:7.3f}s")
+
+
+if __name__ == "__main__":
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    run(pages, [1, 2, 4, 8])
@@ -0,0 +1,246 @@
+import os
+import threading
+from collections import Counter, OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# ------------------ Settings ------------------
+STATS_CHUNK_ROWS = 100_000
+SKETCH_LEVEL_SIZE = 8192        # values kept per sketch level; exact below this
+TOP_CANDIDATES = 10_000        # distinct strings tracked per column for top/freq
+STATS_CACHE_ENTRIES = 32
+PERCENTILES = (0.25, 0.5, 0.75)
+
+
+# ------------------ Mergeable summaries ------------------
+class Moments:
+    # Count, mean, sum of squared deviations, min and max of a column.
+    # Chunks and partial results combine with Chan's parallel update.
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values):
+        if len(values) == 0:
+            return
+        other = Moments()
+        other.count = len(values)
+        other.mean = float(values.mean())
+        other.m2 = float(((values - other.mean) ** 2).sum())
+        other.min = float(values.min())
+        other.max = float(values.max())
+        self.merge(other)
+
+    def merge(self, other):
+        if other.count == 0:
+            return
+        n = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / n
+        self.mean += delta * other.count / n
+        self.count = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def std(self):
+        return float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else np.nan
+
+
+class QuantileSketch:
+    # Compacting quantile sketch. Values land in level 0; a level that grows
+    # past level_size is sorted and every other value (random offset) moves
+    # up a level with twice the weight. Memory is level_size per level, i.e.
+    # O(level_size * log(n / level_size)), and rank error shrinks with
+    # level_size. Until the first compaction the sketch holds every value
+    # and quantiles are exact.
+
+    def __init__(self, level_size=SKETCH_LEVEL_SIZE, seed=0):
+        self.level_size = level_size
+        self.levels = [np.empty(0)]
+        self.count = 0
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        if len(values) == 0:
+            return
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.count += len(values)
+        self._compact()
+
+    def merge(self, other):
+        for h, level in enumerate(other.levels):
+            if h == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[h] = np.concatenate([self.levels[h], level])
+        self.count += other.count
+        self._compact()
+
+    def _compact(self):
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) > self.level_size:
+                level = np.sort(level)
+                # An odd value out stays behind so total weight is kept.
+                keep = len(level) % 2
+                promoted = level[keep:][self._rng.integers(2)::2]
+                self.levels[h] = level[:keep]
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+            h += 1
+
+    def quantile(self, qs):
+        if self.count == 0:
+            return [np.nan] * len(qs)
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(l), 2.0 ** h) for h, l in enumerate(self.levels)])
+        order = np.argsort(values, kind="stable")
+        values, weights = values[order], weights[order]
+        # Each value sits at the middle of the ranks it stands for; with unit
+        # weights this is pandas' linear interpolation between order statistics.
+        ranks = np.cumsum(weights) - weights + (weights - 1) / 2
+        return [float(np.interp(q * (weights.sum() - 1), ranks, values)) for q in qs]
+
+
+class ValueCounter:
+    # count/unique/top/freq of a string column in bounded memory: distinct
+    # values are kept as 64-bit hashes, and the running tallies are trimmed
+    # to the most common candidates once they pass twice that many (exact
+    # whenever a column has fewer distinct values).
+
+    def __init__(self, candidates=TOP_CANDIDATES):
+        self.candidates = candidates
+        self.count = 0
+        self.hashes = np.empty(0, dtype=np.uint64)
+        self.tallies = Counter()
+
+    def update(self, values):
+        if len(values) == 0:
+            return
+        # Count first and stringify only the distinct values.
+        counts = values.value_counts()
+        counts.index = counts.index.astype(str)
+        counts = counts.groupby(level=0).sum()
+        self.count += int(counts.sum())
+        self.hashes = np.union1d(self.hashes, pd.util.hash_array(counts.index.to_numpy(dtype=object)))
+        self.tallies.update(counts.to_dict())
+        self._trim()
+
+    def merge(self, other):
+        self.count += other.count
+        self.hashes = np.union1d(self.hashes, other.hashes)
+        self.tallies.update(other.tallies)
+        self._trim()
+
+    def _trim(self):
+        if len(self.tallies) > 2 * self.candidates:
+            self.tallies = Counter(dict(self.tallies.most_common(self.candidates)))
+
+    def describe(self):
+        top, freq = self.tallies.most_common(1)[0] if self.tallies else (np.nan, np.nan)
+        return [self.count, len(self.hashes), top, freq]
+
+
+# ------------------ One-pass describe ------------------
+class CsvStats:
+    # Streaming equivalent of DataFrame.describe(): numeric columns get
+    # count/mean/std/min/quartiles/max; when there are none, the string
+    # columns get count/unique/top/freq as describe() would show.
+
+    def __init__(self, level_size=SKETCH_LEVEL_SIZE):
+        self.level_size = level_size
+        self.columns = []
+        self.non_numeric = set()
+        self.moments = {}
+        self.sketches = {}
+        self.values = {}
+
+    def _add_column(self, col):
+        if col not in self.moments:
+            self.columns.append(col)
+            self.moments[col] = Moments()
+            self.sketches[col] = QuantileSketch(self.level_size)
+            self.values[col] = ValueCounter()
+
+    def update(self, chunk):
+        for col in chunk.columns:
+            self._add_column(col)
+            series = chunk[col].dropna()
+            # A column that reads as text in any chunk is text in the whole
+            # file, as it would be for a single read_csv call. Values seen
+            # while it still looked numeric only count towards its count.
+            if col not in self.non_numeric and len(series) and not _is_numeric(series):
+                self.non_numeric.add(col)
+                self.values[col].count += self.moments[col].count
+            if col in self.non_numeric:
+                self.values[col].update(series)
+            else:
+                values = series.to_numpy(dtype=float)
+                self.moments[col].update(values)
+                self.sketches[col].update(values)
+
+    def merge(self, other):
+        for col in other.columns:
+            self._add_column(col)
+            self.moments[col].merge(other.moments[col])
+            self.sketches[col].merge(other.sketches[col])
+            self.values[col].merge(other.values[col])
+        self.non_numeric |= other.non_numeric
+
+    def describe(self):
+        numeric = [c for c in self.columns if c not in self.non_numeric]
+        if numeric:
+            index = ["count", "mean", "std", "min"] + [f"{q:.0%}" for q in PERCENTILES] + ["max"]
+            table = {}
+            for col in numeric:
+                m = self.moments[col]
+                empty = m.count == 0
+                table[col] = [
+                    float(m.count),
+                    np.nan if empty else m.mean,
+                    m.std(),
+                    np.nan if empty else m.min,
+                    *self.sketches[col].quantile(PERCENTILES),
+                    np.nan if empty else m.max,
+                ]
+            return pd.DataFrame(table, index=index, columns=numeric)
+
+        table = {col: self.values[col].describe() for col in self.columns}
+        return pd.DataFrame(table, index=["count", "unique", "top", "freq"],
+                            columns=self.columns, dtype=object)
+
+
+def _is_numeric(series):
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+
+_cache = OrderedDict()      # (path, size, mtime) -> describe table
+_cache_lock = threading.Lock()
+
+
+def describe_csv(path, chunk_rows=STATS_CHUNK_ROWS):
+    # One chunked pass over the file; the table is cached until the file
+    # changes, so every page asking for it after the first gets it for free.
+    info = os.stat(path)
+    key = (os.path.abspath(path), info.st_size, info.st_mtime_ns)
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+    stats = CsvStats()
+    for chunk in pd.read_csv(path, chunksize=chunk_rows):
+        stats.update(chunk)
+    table = stats.describe()
+
+    with _cache_lock:
+        _cache[key] = table
+        while len(_cache) > STATS_CACHE_ENTRIES:
+            _cache.popitem(last=False)
+    return table
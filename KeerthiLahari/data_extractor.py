@@ -1,6 +1,100 @@
-import pandas as pd
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from PyPDF2 import PdfReader
-from io import StringIO
+from io import BytesIO, StringIO
+
+# PDF extraction settings
+PDF_WORKERS = os.cpu_count() or 1
+MIN_PAGES_PER_WORKER = 20
+PAGE_CACHE_MAX_CHARS = 50_000_000
+
+_page_cache = OrderedDict()     # (file hash, page number) -> page text
+_page_cache_chars = 0
+_page_counts = {}               # file hash -> number of pages
+_cache_lock = threading.Lock()
+_pdf_pool = None
+_pdf_pool_workers = None
+
+
+# ------------------ PDF extraction ------------------
+def _extract_pages(data, page_numbers):
+    # Runs in a worker process: open the PDF from bytes and extract a range.
+    reader = PdfReader(BytesIO(data))
+    return [(i, reader.pages[i].extract_text() or "") for i in page_numbers]
+
+
+def _get_pdf_pool(workers):
+    global _pdf_pool, _pdf_pool_workers
+    if _pdf_pool is None or _pdf_pool_workers != workers:
+        if _pdf_pool is not None:
+            _pdf_pool.shutdown(wait=False)
+        _pdf_pool = ProcessPoolExecutor(max_workers=workers)
+        _pdf_pool_workers = workers
+    return _pdf_pool
+
+
+def _cache_pages(file_hash, pages):
+    global _page_cache_chars
+    with _cache_lock:
+        for i, text in pages:
+            key = (file_hash, i)
+            if key not in _page_cache:
+                _page_cache_chars += len(text)
+            _page_cache[key] = text
+        while _page_cache_chars > PAGE_CACHE_MAX_CHARS and _page_cache:
+            _, old = _page_cache.popitem(last=False)
+            _page_cache_chars -= len(old)
+
+
+def extract_pdf_text(data, pages=None, workers=PDF_WORKERS):
+    # Pages already seen for this file (same bytes) come from the page
+    # cache; the rest are split into contiguous ranges, one per worker,
+    # and the results joined once in page order.
+    file_hash = hashlib.sha256(data).hexdigest()
+    if pages is None:
+        if file_hash not in _page_counts:
+            _page_counts[file_hash] = len(PdfReader(BytesIO(data)).pages)
+        pages = range(_page_counts[file_hash])
+    pages = list(pages)
+
+    with _cache_lock:
+        cached = {i: _page_cache[(file_hash, i)] for i in pages if (file_hash, i) in _page_cache}
+        for i in cached:
+            _page_cache.move_to_end((file_hash, i))
+    missing = [i for i in pages if i not in cached]
+
+    if missing:
+        n_workers = min(workers, len(missing) // MIN_PAGES_PER_WORKER)
+        if n_workers > 1:
+            size = -(-len(missing) // n_workers)
+            ranges = [missing[i:i + size] for i in range(0, len(missing), size)]
+            pool = _get_pdf_pool(workers)
+            extracted = [p for part in pool.map(_extract_pages, [data] * len(ranges), ranges) for p in part]
+        else:
+            extracted = _extract_pages(data, missing)
+        _cache_pages(file_hash, extracted)
+        cached.update(extracted)
+
+    return "".join(cached[i] for i in pages)
+
+
+def fingerprint_input(uploaded_file=None, pasted_text=None):
+    # Same precedence as extract_text_from_file: pasted text wins.
+    h = hashlib.sha256()
+    if pasted_text and pasted_text.strip():
+        h.update(b"paste\0")
+        h.update(pasted_text.encode("utf-8", errors="surrogatepass"))
+    elif uploaded_file is not None:
+        h.update(b"file\0")
+        h.update(uploaded_file.name.encode("utf-8"))
+        h.update(b"\0")
+        h.update(uploaded_file.getvalue())
+    else:
+        return None
+    return h.hexdigest()
 
 
 def extract_text_from_file(uploaded_file=None, pasted_text=None):
@@ -21,15 +115,12 @@ def extract_text_from_file(uploaded_file=None, pasted_text=None):
             return text, "txt", None, None
 
         elif file_type == "pdf":
-            reader = PdfReader(uploaded_file)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() or ""
+            text = extract_pdf_text(uploaded_file.getvalue())
             return text, "pdf", None, None
 
         elif file_type == "csv":
-            df = pd.read_csv(uploaded_file)
-            return None, "csv", df, None
+            # Not loaded here: preprocess_csv streams it in chunks.
+            return None, "csv", None, None
 
         return None, None, None, "Unsupported file format."
 
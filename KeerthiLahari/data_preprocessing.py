@@ -1,19 +1,24 @@
 import os
 import re
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
-
-OUTPUT_DIR = "Final_data"
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-stop_words = set(stopwords.words("english"))
-lemmatizer = WordNetLemmatizer()
+import pandas as pd
 
 custom_stopwords = set([
     "http", "https", "www", "com",
     "page", "figure", "table"
 ])
 
+# CSV cleaning settings
+CSV_CHUNK_ROWS = 50_000
+TEXT_SAMPLE_ROWS = 1_000
+TEXT_MIN_SPACED = 0.5       # share of sampled values that contain a space
+TYPED_MIN_SHARE = 0.9       # share of sampled values that parse as number/date
+
+# clean_text maps disallowed characters to spaces and then collapses all
+# whitespace, so any run of disallowed-or-space characters ends up as one
+# space: a single substitution does both steps.
+_SEPARATOR_RUN = r"[^a-zA-Z0-9.,!?']+"
+_DATE_RE = re.compile(r"^\d{1,4}[-/.]\d{1,2}[-/.]\d{1,4}([ T]\d{1,2}:\d{2}(:\d{2})?\S*)?$")
+
 
 def clean_text(text):
     text = re.sub(r"[^a-zA-Z0-9.,!?'\s]", " ", text)
@@ -23,31 +28,81 @@ def clean_text(text):
     return text.strip()
 
 
+# ------------------ CSV columns ------------------
+def clean_series(series):
+    # Vectorized clean_text over a column; missing cells stay missing.
+    present = series.notna()
+    cleaned = (series[present].astype(str)
+               .str.replace(_SEPARATOR_RUN, " ", regex=True)
+               .str.strip())
+    out = series.astype(object)
+    out[present] = cleaned
+    return out
+
+
+def detect_text_columns(sample):
+    # Free-text columns among the string columns of a row sample: mostly
+    # values with spaces in them, and not mostly numbers, IDs or dates.
+    columns = []
+    for col in sample.select_dtypes(include=["object", "string"]).columns:
+        values = sample[col].dropna().astype(str)
+        if values.empty:
+            continue
+        if pd.to_numeric(values, errors="coerce").notna().mean() >= TYPED_MIN_SHARE:
+            continue
+        if values.str.strip().str.match(_DATE_RE).mean() >= TYPED_MIN_SHARE:
+            continue
+        if values.str.contains(" ", regex=False).mean() >= TEXT_MIN_SPACED:
+            columns.append(col)
+    return columns
+
+
+def _clean_frame(df, text_columns):
+    for col in text_columns:
+        if col in df.columns:
+            df[col] = clean_series(df[col])
+    return df
+
+
+def preprocess_csv(source, output_path, csv_text_columns=None,
+                   chunk_rows=CSV_CHUNK_ROWS, progress=None):
+    # Cleans a CSV of any size chunk by chunk and streams the result to
+    # output_path, so only one chunk is ever held in memory.
+    try:
+        if hasattr(source, "seek"):
+            source.seek(0)
+        size = getattr(source, "size", None)
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        tmp = f"{output_path}.tmp"
+        rows = 0
+        with open(tmp, "w", encoding="utf-8", newline="") as out:
+            for i, chunk in enumerate(pd.read_csv(source, chunksize=chunk_rows)):
+                if csv_text_columns is None:
+                    csv_text_columns = detect_text_columns(chunk.head(TEXT_SAMPLE_ROWS))
+                _clean_frame(chunk, csv_text_columns).to_csv(out, header=i == 0, index=False)
+                rows += len(chunk)
+                if progress and size:
+                    progress(min(source.tell() / size, 1.0))
+        os.replace(tmp, output_path)
+        return {"path": output_path, "rows": rows, "text_columns": csv_text_columns}, None
+
+    except Exception as e:
+        return None, f"Preprocessing error: {str(e)}"
+
+
 def preprocess_text(text, file_type, df=None, csv_text_columns=None):
     try:
         # -------- TXT or PDF -------- #
         if file_type in ["txt", "pdf"]:
             cleaned = clean_text(text)
-
-            save_path = os.path.join(OUTPUT_DIR, "processed_text.txt")
-            with open(save_path, "w") as f:
-                f.write(cleaned)
-
             return cleaned, None
 
         # -------- CSV -------- #
         if file_type == "csv":
             if csv_text_columns is None:
-                csv_text_columns = \
-                    df.select_dtypes(include=["object"]).columns.tolist()
-
-            for col in csv_text_columns:
-                df[col] = df[col].astype(str).apply(clean_text)
-
-            save_path = os.path.join(OUTPUT_DIR, "processed_csv.csv")
-            df.to_csv(save_path, index=False)
+                csv_text_columns = detect_text_columns(df.head(TEXT_SAMPLE_ROWS))
 
-            return df, None
+            return _clean_frame(df, csv_text_columns), None
 
         return None, "Unsupported file type."
 
@@ -0,0 +1,91 @@
+import importlib
+import threading
+import time
+
+# ------------------ Registry ------------------
+# Heavy modules and models, loaded on first use instead of at app start so
+# the first page paint does not wait for plotly, sklearn or NLTK.
+_loaders = {}
+_loaded = {}
+_load_times = {}
+_locks = {}
+_registry_lock = threading.Lock()
+_warmup_thread = None
+
+
+def register(name, loader):
+    _loaders[name] = loader
+    _locks[name] = threading.Lock()
+
+
+def load(name):
+    if name in _loaded:
+        return _loaded[name]
+    with _locks[name]:
+        if name not in _loaded:
+            start = time.perf_counter()
+            _loaded[name] = _loaders[name]()
+            _load_times[name] = time.perf_counter() - start
+    return _loaded[name]
+
+
+def is_loaded(name):
+    return name in _loaded
+
+
+def load_times():
+    return dict(_load_times)
+
+
+# ------------------ Background warm-up ------------------
+def _warm(names):
+    for name in names:
+        try:
+            load(name)
+        except Exception:
+            # Left for the page that needs it to load, and report, later.
+            pass
+
+
+def warm_up(names=None):
+    # Loads everything not yet loaded in a daemon thread, once per process.
+    # Call after the first paint: pages then find most modules ready.
+    global _warmup_thread
+    with _registry_lock:
+        if _warmup_thread is None:
+            todo = [n for n in (names or list(_loaders)) if n not in _loaded]
+            _warmup_thread = threading.Thread(target=_warm, args=(todo,), name="warm-up", daemon=True)
+            _warmup_thread.start()
+    return _warmup_thread
+
+
+# ------------------ Entries ------------------
+def _module(path):
+    return lambda: importlib.import_module(path)
+
+
+def _nltk_tokenize():
+    import nltk
+    try:
+        nltk.data.find("tokenizers/punkt")
+    except LookupError:
+        nltk.download("punkt")
+    return importlib.import_module("nltk.tokenize")
+
+
+def _vader():
+    import nltk
+    nltk.download("vader_lexicon", quiet=True)
+    from nltk.sentiment import SentimentIntensityAnalyzer
+    return SentimentIntensityAnalyzer()
+
+
+# Registered in the order the warm-up loads them: what the Input and
+# Analysis pages need first.
+register("nltk_tokenize", _nltk_tokenize)
+register("sklearn_text", _module("sklearn.feature_extraction.text"))
+register("sklearn_decomposition", _module("sklearn.decomposition"))
+register("vader", _vader)
+register("plotly", _module("plotly.express"))
+register("wordcloud", _module("wordcloud"))
+register("pyplot", _module("matplotlib.pyplot"))
@@ -1,8 +1,15 @@
-import nltk
-from nltk.sentiment import SentimentIntensityAnalyzer
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from collections import Counter
-nltk.download("vader_lexicon", quiet=True)
-sia = SentimentIntensityAnalyzer()
+from lazy_loader import load
+
+# Sharded scoring settings
+SHARD_SIZE = 500            # sentences per batch sent to a worker
+MIN_PARALLEL_SENTENCES = 2000
+MAX_WORKERS = os.cpu_count() or 1
+_pool = None
+_pool_workers = None
 
 # ------------ BASIC METRICS ---------------- #
 
@@ -20,11 +27,76 @@ def top_tokens(text, n=10):
     return Counter(tokens).most_common(n)
 
 
-def sentiment_analysis(text):
-    return sia.polarity_scores(text)
+def sentiment_analysis(text, sharded=False, workers=MAX_WORKERS):
+    if not sharded:
+        return load("vader").polarity_scores(text)
+    return sharded_sentiment_analysis(text, workers)
+
+
+# ------------ SHARDED SENTIMENT ---------------- #
+
+
+def _score_batch(sentences):
+    # Runs in a worker process; each worker loads its own VADER model.
+    sia = load("vader")
+    rows = []
+    for s in sentences:
+        scores = sia.polarity_scores(s)
+        rows.append((scores["neg"], scores["neu"], scores["pos"], scores["compound"]))
+    return rows
+
+
+def _get_pool(workers):
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != workers:
+        if _pool is not None:
+            _pool.shutdown(wait=False)
+        _pool = ProcessPoolExecutor(max_workers=workers)
+        _pool_workers = workers
+    return _pool
+
+
+def sharded_sentiment_analysis(text, workers=MAX_WORKERS):
+    # Scores every sentence (in batches on a process pool for large inputs)
+    # and aggregates: neg/neu/pos/compound are averages weighted by sentence
+    # length in words, and sentence_labels counts sentences per label using
+    # VADER's +/-0.05 compound thresholds.
+    sentences = [s for s in load("nltk_tokenize").sent_tokenize(text) if s.strip()]
+    if not sentences:
+        scores = load("vader").polarity_scores(text)
+        scores["sentence_labels"] = {"Positive": 0, "Negative": 0, "Neutral": 0}
+        return scores
+
+    batches = [sentences[i:i + SHARD_SIZE] for i in range(0, len(sentences), SHARD_SIZE)]
+    if workers > 1 and len(sentences) >= MIN_PARALLEL_SENTENCES:
+        rows = [r for batch in _get_pool(workers).map(_score_batch, batches) for r in batch]
+    else:
+        rows = [r for batch in batches for r in _score_batch(batch)]
+
+    values = np.array(rows)
+    weights = np.array([max(len(s.split()), 1) for s in sentences], dtype=float)
+    neg, neu, pos, compound = np.average(values, axis=0, weights=weights)
+    compounds = values[:, 3]
+    return {
+        "neg": round(float(neg), 3),
+        "neu": round(float(neu), 3),
+        "pos": round(float(pos), 3),
+        "compound": round(float(compound), 4),
+        "sentence_labels": {
+            "Positive": int((compounds >= 0.05).sum()),
+            "Negative": int((compounds <= -0.05).sum()),
+            "Neutral": int(((compounds > -0.05) & (compounds < 0.05)).sum()),
+        },
+    }
 
 
 def sentiment_distribution(sentiment_scores):
+    # Sharded results carry real per-sentence label counts; report the share
+    # of sentences per label. Otherwise fall back to VADER's pos/neg/neu.
+    labels = sentiment_scores.get("sentence_labels")
+    if labels:
+        total = max(sum(labels.values()), 1)
+        return {k: labels[k] / total for k in ("Positive", "Negative", "Neutral")}
     return {
         "Positive": sentiment_scores.get("pos", 0),
         "Negative": sentiment_scores.get("neg", 0),
@@ -0,0 +1,129 @@
+import math
+import os
+import re
+import string
+import threading
+from collections import Counter, OrderedDict
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# ------------------ Settings ------------------
+READABILITY_CHUNK_ROWS = 100_000
+SYLLABLE_CACHE_SIZE = 200_000
+CACHE_ENTRIES = 32
+
+# Everything but letters and apostrophes splits words; str.translate and
+# str.split are several times faster than a findall over the whole text.
+_SEPARATORS = str.maketrans({ch: " " for ch in string.punctuation.replace("'", "") + string.digits})
+_LETTERS = re.compile(r"[a-z]")
+_VOWEL_RUN = re.compile(r"[aeiouy]+")
+_SENTENCE_ENDS = np.frombuffer(b".!?", dtype=np.uint8)
+
+
+# ------------------ Syllables ------------------
+@lru_cache(maxsize=SYLLABLE_CACHE_SIZE)
+def syllables(word):
+    # Vowel groups, less a silent final "e" / "es" / "ed" after a consonant
+    # (an "e" after a vowel is already part of that vowel's group); at least one.
+    word = word.strip("'")
+    count = len(_VOWEL_RUN.findall(word))
+    if count > 1:
+        if word.endswith("e"):
+            # "-le" after a consonant is its own syllable: table, simple
+            if word[-2] not in "aeiouy" and not (word.endswith("le") and word[-3:-2] not in "aeiouy"):
+                count -= 1
+        elif word[-3:-2] not in "aeiouy":
+            if word.endswith("es") and not word.endswith(("ses", "zes", "ches", "shes", "ges", "ces", "xes")):
+                count -= 1
+            elif word.endswith("ed") and not word.endswith(("ted", "ded")):
+                count -= 1
+    return max(count, 1)
+
+
+def sentence_total(text):
+    # Runs of . ! ? (so "..." is one end), plus an unterminated last sentence.
+    raw = np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+    ends = np.isin(raw, _SENTENCE_ENDS)
+    total = int(ends[:1].sum() + (ends[1:] & ~ends[:-1]).sum())
+    stripped = text.rstrip()
+    if stripped and stripped[-1] not in ".!?":
+        total += 1
+    return total
+
+
+# ------------------ Counts ------------------
+def count_text(text):
+    # Totals the indices are built from. Each distinct word is looked up
+    # once; per-word syllables then weight the counts in one array pass.
+    freq = Counter(text.lower().translate(_SEPARATORS).split())
+    words = [w for w in freq if _LETTERS.search(w)]
+    counts = np.fromiter((freq[w] for w in words), dtype=np.int64, count=len(words))
+    syl = np.fromiter((syllables(w) for w in words), dtype=np.int64, count=len(words))
+    return {
+        "words": int(counts.sum()),
+        "sentences": sentence_total(text),
+        "syllables": int(counts @ syl),
+        "polysyllables": int(counts[syl >= 3].sum()),
+    }
+
+
+def merge_counts(a, b):
+    return {k: a[k] + b[k] for k in a}
+
+
+# ------------------ Indices ------------------
+def readability_scores(counts):
+    words = counts["words"]
+    sentences = max(counts["sentences"], 1)
+    if words == 0:
+        return {"Flesch Reading Ease": None, "Flesch-Kincaid Grade": None, "Gunning Fog": None, "SMOG": None}
+    wps = words / sentences
+    spw = counts["syllables"] / words
+    return {
+        "Flesch Reading Ease": round(206.835 - 1.015 * wps - 84.6 * spw, 2),
+        "Flesch-Kincaid Grade": round(0.39 * wps + 11.8 * spw - 15.59, 2),
+        "Gunning Fog": round(0.4 * (wps + 100 * counts["polysyllables"] / words), 2),
+        "SMOG": round(1.0430 * math.sqrt(counts["polysyllables"] * 30 / sentences) + 3.1291, 2),
+    }
+
+
+def readability(text):
+    return readability_scores(count_text(text))
+
+
+# ------------------ CSV text columns ------------------
+_cache = OrderedDict()      # (path, size, mtime, columns) -> scores per column
+_cache_lock = threading.Lock()
+
+
+def csv_readability(path, columns=None, chunk_rows=READABILITY_CHUNK_ROWS):
+    # Scores each free-text column as one document (every cell a sentence
+    # or more), streaming the file in chunks. Cached until the file changes.
+    from data_preprocessing import detect_text_columns
+
+    info = os.stat(path)
+    key = (os.path.abspath(path), info.st_size, info.st_mtime_ns, tuple(columns or ()))
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+    totals = {}
+    for chunk in pd.read_csv(path, chunksize=chunk_rows):
+        if columns is None:
+            columns = detect_text_columns(chunk)
+        for col in columns:
+            cells = chunk[col].dropna().astype(str)
+            if cells.empty:
+                continue
+            counts = count_text(". ".join(cells))
+            totals[col] = merge_counts(totals[col], counts) if col in totals else counts
+    scores = {col: readability_scores(counts) for col, counts in totals.items()}
+
+    with _cache_lock:
+        _cache[key] = scores
+        while len(_cache) > CACHE_ENTRIES:
+            _cache.popitem(last=False)
+    return scores
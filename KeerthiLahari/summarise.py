@@ -1,100 +1,155 @@
-import os
-import random
+import threading
 import numpy as np
-import nltk
-import pandas as pd
-from collections import Counter
-from nltk.tokenize import sent_tokenize
-from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
-from sklearn.decomposition import LatentDirichletAllocation, NMF
-
-# ------------------ Ensure NLTK data ------------------
-try:
-    nltk.data.find("tokenizers/punkt")
-except LookupError:
-    nltk.download("punkt")
-
-# ------------------ Paths ------------------
-TEXT_FILE = "Final_data/processed_text.txt"
-CSV_FILE = "Final_data/processed_csv.csv"
+from collections import OrderedDict
+from artifact_store import get_artifact, content_hash
+from csv_stats import describe_csv
+from lazy_loader import load
 
 # ------------------ Load processed text ------------------
 def load_processed_text():
-    if not os.path.exists(TEXT_FILE):
-        return None
-    with open(TEXT_FILE, "r", encoding="utf-8") as f:
-        return f.read().strip()
+    text = get_artifact("processed_text")
+    return text.strip() if text else None
 
 # ------------------ Chunk text by sentences ------------------
 def chunk_text_by_sentences(text, chunk_size=4):
-    sentences = sent_tokenize(text)
+    sentences = load("nltk_tokenize").sent_tokenize(text)
     return [
         " ".join(sentences[i:i + chunk_size])
         for i in range(0, len(sentences), chunk_size)
     ]
 
+# ------------------ Shared chunk-term model ------------------
+MODEL_CACHE_SIZE = 16
+_model_cache = OrderedDict()
+_model_cache_lock = threading.Lock()
+
+
+def build_chunk_model(text, chunk_size=4):
+    # Vectorizes the sentence chunks once; LDA and NMF keyword weights and
+    # the chunk scores all reuse this one sparse chunk-by-term matrix.
+    key = (content_hash(text), chunk_size)
+    with _model_cache_lock:
+        if key in _model_cache:
+            _model_cache.move_to_end(key)
+            return _model_cache[key]
+
+    chunks = chunk_text_by_sentences(text, chunk_size=chunk_size)
+    model = {"chunks": chunks, "X": None, "words": None, "keywords": {}}
+    if len(chunks) >= 2:
+        vectorizer = load("sklearn_text").CountVectorizer(stop_words="english", max_df=1.0, min_df=1)
+        try:
+            model["X"] = vectorizer.fit_transform(chunks)
+            model["words"] = vectorizer.get_feature_names_out()
+        except ValueError:
+            # Only stop words in the text: nothing to score chunks with.
+            pass
+
+    with _model_cache_lock:
+        _model_cache[key] = model
+        while len(_model_cache) > MODEL_CACHE_SIZE:
+            _model_cache.popitem(last=False)
+    return model
+
+
+# ------------------ Keyword weights ------------------
+def _keyword_indices(model, name, top_n=10):
+    key = (name, top_n)
+    if key not in model["keywords"]:
+        if name == "NMF":
+            nmf = load("sklearn_decomposition").NMF(n_components=1, random_state=42, max_iter=500)
+            nmf.fit(load("sklearn_text").TfidfTransformer().fit_transform(model["X"]))
+            components = nmf.components_
+        else:
+            lda = load("sklearn_decomposition").LatentDirichletAllocation(n_components=1, random_state=42)
+            lda.fit(model["X"])
+            components = lda.components_
+        model["keywords"][key] = components[0].argsort()[-top_n:]
+    return model["keywords"][key]
+
 # ------------------ LDA keywords ------------------
-def extract_keywords_lda(text, top_n=10):
-    vectorizer = CountVectorizer(
-        stop_words="english",
-        max_df=1.0,
-        min_df=1
-    )
-    X = vectorizer.fit_transform([text])
-    lda = LatentDirichletAllocation(n_components=1, random_state=42)
-    lda.fit(X)
-    words = vectorizer.get_feature_names_out()
-    indices = lda.components_[0].argsort()[-top_n:]
-    return [words[i] for i in indices]
+def extract_keywords_lda(model, top_n=10):
+    return [model["words"][i] for i in _keyword_indices(model, "LDA", top_n)]
 
 # ------------------ NMF keywords ------------------
-def extract_keywords_nmf(text, top_n=10):
-    vectorizer = TfidfVectorizer(
-        stop_words="english",
-        max_df=1.0,
-        min_df=1,
-        ngram_range=(1, 2)
-    )
-    X = vectorizer.fit_transform([text])
-    nmf = NMF(n_components=1, random_state=42, max_iter=500)
-    nmf.fit(X)
-    words = vectorizer.get_feature_names_out()
-    indices = nmf.components_[0].argsort()[-top_n:]
-    return [words[i] for i in indices]
+def extract_keywords_nmf(model, top_n=10):
+    return [model["words"][i] for i in _keyword_indices(model, "NMF", top_n)]
+
+# ------------------ Redundancy-aware selection ------------------
+SUMMARY_RATIO = 0.4     # share of the text (chunks, or characters for MMR) kept
+MMR_LAMBDA = 0.7        # relevance vs. novelty trade-off
+MMR_DUPLICATE_SIM = 0.8 # chunks at least this close to a picked one are dropped
+
+
+def _unit_rows(model):
+    # TF-IDF chunk vectors scaled to unit length, so a sparse dot product
+    # is the cosine similarity between two chunks.
+    if "unit" not in model:
+        model["unit"] = load("sklearn_text").TfidfTransformer().fit_transform(model["X"]).tocsr()
+    return model["unit"]
+
+
+def select_chunks_mmr(unit, scores, lengths, budget, lam=MMR_LAMBDA):
+    # Maximal marginal relevance: repeatedly pick the chunk with the best
+    # lam * relevance - (1 - lam) * (similarity to the closest picked chunk).
+    # max_sim is updated with one sparse mat-vec per pick, so k picks over
+    # n chunks cost O(n * k). Near-duplicates of a picked chunk drop out;
+    # selection stops at the length budget or when no candidate is left.
+    relevance = scores / scores.max() if scores.max() > 0 else scores
+    max_sim = np.zeros(len(scores))
+    available = np.ones(len(scores), dtype=bool)
+    picked = []
+    used = 0
+    while available.any():
+        gain = np.where(available, lam * relevance - (1 - lam) * max_sim, -np.inf)
+        i = int(np.argmax(gain))
+        if picked and used + lengths[i] > budget:
+            break
+        picked.append(i)
+        used += lengths[i]
+        available[i] = False
+        max_sim = np.maximum(max_sim, unit @ unit[i].toarray().ravel())
+        available &= max_sim < MMR_DUPLICATE_SIM
+    return np.sort(picked)
+
 
 # ------------------ Main summary function ------------------
-def generate_abstractive_summary():
-    text = load_processed_text()
+def generate_abstractive_summary(text=None, models=("LDA", "NMF"), selection="mmr", max_chars=None):
+    if text is None:
+        text = load_processed_text()
     if not text:
         return None, "❌ Please preprocess text first."
 
-    chunks = chunk_text_by_sentences(text, chunk_size=4)
-    if len(chunks) < 2:
+    model = build_chunk_model(text, chunk_size=4)
+    chunks = model["chunks"]
+    if len(chunks) < 2 or model["X"] is None:
         return "Fallback", text
 
-    model_used = random.choice(["LDA", "NMF"])
-    keywords = extract_keywords_nmf(text) if model_used == "NMF" else extract_keywords_lda(text)
-    keyword_counts = Counter(keywords)
+    # Keyword weight per term: how many of the chosen models picked it.
+    weights = np.zeros(len(model["words"]))
+    for name in models:
+        weights[_keyword_indices(model, name)] += 1
 
-    scores = []
-    for idx, chunk in enumerate(chunks):
-        words = chunk.lower().split()
-        score = sum(keyword_counts.get(w, 0) for w in words)
-        score += 0.1 / (idx + 1)  # Position bias: early chunks slightly preferred
-        scores.append(score)
+    scores = model["X"] @ weights
+    scores += 0.1 / np.arange(1, len(chunks) + 1)  # Position bias: early chunks slightly preferred
 
-    # Select top 30-40% chunks
-    top_n = max(1, int(len(chunks) * 0.4))
-    top_indices = np.argsort(scores)[-top_n:]
-    top_indices.sort()
+    if selection == "mmr":
+        # Non-redundant chunks up to max_chars (default 40% of the text).
+        lengths = np.array([len(c) for c in chunks])
+        budget = max_chars if max_chars is not None else SUMMARY_RATIO * lengths.sum()
+        top_indices = select_chunks_mmr(_unit_rows(model), scores, lengths, budget)
+    else:
+        # Select top 30-40% chunks
+        top_n = max(1, int(len(chunks) * SUMMARY_RATIO))
+        top_indices = np.argsort(scores)[-top_n:]
+        top_indices.sort()
 
     summary = " ".join(chunks[i] for i in top_indices)
-    return model_used, summary
+    return " + ".join(models), summary
 
 # ------------------ CSV summary ------------------
 def summarize_csv():
-    if not os.path.exists(CSV_FILE):
+    csv_path = get_artifact("processed_csv")
+    if csv_path is None:
         return None
-    df = pd.read_csv(CSV_FILE)
-    # Only return the describe() for numerical columns
-    return df.describe()
+    # describe() of the cleaned CSV in one streaming pass, cached per file
+    return describe_csv(csv_path)
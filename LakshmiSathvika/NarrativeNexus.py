@@ -1,6 +1,6 @@
 import streamlit as st
-from utils.file_reader import read_file
-from utils.text_processor import process_text, get_stats
+from utils.file_reader import read_file, iter_file
+from utils.text_processor import normalize, iter_process_text
 from utils.summarizer import SmartSummarizer
 from utils.sentiment_analyzer import SentimentAnalyzer
 
@@ -11,10 +11,38 @@ st.set_page_config(
     layout="wide",
 )
 
+STREAM_MIN_BYTES = 50 * 1024 * 1024   # larger uploads are never held as one string
+PREVIEW_CHARS = 2000
+
 # Load CSS
 with open('styles.css') as f:
     st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
 
+def process_large_file(uploaded_file, method, progress=None):
+    """
+    Stream a large upload: one pass cleans it and counts stats, a second
+    builds the summary. Only the first PREVIEW_CHARS of the original and
+    processed text are kept, for the comparison view.
+    """
+    original = ''
+    processed = ''
+    stats = {}
+    
+    def keep_preview(blocks):
+        nonlocal original
+        for block in blocks:
+            if len(original) < PREVIEW_CHARS:
+                original += block[:PREVIEW_CHARS - len(original)]
+            yield block
+    
+    for piece in iter_process_text(keep_preview(iter_file(uploaded_file)), stats):
+        if len(processed) < PREVIEW_CHARS:
+            processed += piece[:PREVIEW_CHARS - len(processed)]
+    
+    uploaded_file.seek(0)
+    summary = SmartSummarizer.summarize_stream(iter_file(uploaded_file), method=method, progress=progress)
+    return original, processed, stats, summary
+
 def main():
     # Header
     st.markdown("<h1>📊 NarrativeNexus</h1>", unsafe_allow_html=True)
@@ -39,24 +67,45 @@ def main():
         """
         st.info(file_details)
         
+        method = st.radio(
+            "Summarization method",
+            ["Heuristic", "TextRank"],
+            horizontal=True,
+            help="TextRank ranks sentences by their similarity to the rest of the text"
+        )
+        
         if st.button(" Process Text", use_container_width=True):
             with st.spinner("Processing your file..."):
                 try:
-                    # Read file
-                    raw_text = read_file(uploaded_file)
-                    
-                    # Process text (your original processing)
-                    processed_text = process_text(raw_text)
-                    
-                    # Get stats
-                    stats = get_stats(raw_text, processed_text)
+                    # Long documents are summarized section by section; show how far along
+                    progress_bar = st.empty()
+                    def show_progress(done, total, level):
+                        if total is None:
+                            progress_bar.text(f"Summarizing: pass {level}, section {done}")
+                        else:
+                            progress_bar.progress(done / total, text=f"Summarizing: pass {level}, section {done} of {total}")
                     
-                    # Generate meaningful summary (new)
-                    summary = SmartSummarizer.summarize(raw_text, use_ai=False)
+                    if uploaded_file.size > STREAM_MIN_BYTES:
+                        # Large uploads are streamed and only previews are kept
+                        raw_text, processed_text, stats, summary = process_large_file(
+                            uploaded_file, method.lower(), show_progress)
+                        sentiment_source = summary
+                    else:
+                        # Read file
+                        raw_text = read_file(uploaded_file)
+                        
+                        # Process text and get stats in one pass
+                        processed_text, stats = normalize(raw_text)
+                        
+                        # Generate meaningful summary (new)
+                        summary = SmartSummarizer.summarize(raw_text, use_ai=False, method=method.lower(),
+                                                            progress=show_progress)
+                        sentiment_source = raw_text
+                    progress_bar.empty()
                     
                     # Analyze sentiment (new)
                     sentiment_analyzer = SentimentAnalyzer()
-                    sentiment_data = sentiment_analyzer.analyze(raw_text)
+                    sentiment_data = sentiment_analyzer.analyze(sentiment_source)
                     
                     # Store in session state
                     st.session_state.update({
@@ -0,0 +1,89 @@
+"""Throughput and peak memory of the streaming JSON, XML and HTML extractors"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from utils.file_reader import iter_file
+
+WORDS = np.array("the report shows steady growth across all regions while costs remained "
+                 "flat and the team expects further gains in the coming quarter".split())
+
+
+def sentences(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    for _ in range(n):
+        yield " ".join(rng.choice(WORDS, rng.integers(6, 20))).capitalize() + "."
+
+
+def write_json(f, n):
+    f.write('{"records": [\n')
+    for i, s in enumerate(sentences(n)):
+        f.write(f'{"," if i else ""}{{"id": {i}, "score": {i % 7}.5, "title": "Item {i}", "body": "{s}"}}\n')
+    f.write("]}\n")
+
+
+def write_xml(f, n):
+    f.write('<?xml version="1.0"?>\n<records>\n')
+    for i, s in enumerate(sentences(n)):
+        f.write(f'<record id="{i}"><title>Item {i}</title><body>{s} <em>note</em> end</body></record>\n')
+    f.write("</records>\n")
+
+
+def write_html(f, n):
+    f.write("<html><head><style>p { margin: 0 }</style></head><body>\n")
+    for i, s in enumerate(sentences(n)):
+        f.write(f'<div class="row"><h3>Item {i}</h3><p>{s}</p>'
+                f'<script>track({i}, "view");</script></div>\n')
+    f.write("</body></html>\n")
+
+
+WRITERS = {".json": write_json, ".xml": write_xml, ".html": write_html}
+
+
+class NamedFile:
+    """The bits of an uploaded file iter_file uses"""
+    def __init__(self, path):
+        self.name = path
+        self._f = open(path, "rb")
+
+    def read(self, size=-1):
+        return self._f.read(size)
+
+    def close(self):
+        self._f.close()
+
+
+def drain(path: str) -> int:
+    f = NamedFile(path)
+    chars = sum(len(block) for block in iter_file(f))
+    f.close()
+    return chars
+
+
+def run(n_records: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        for ext, writer in WRITERS.items():
+            path = os.path.join(tmp, "sample" + ext)
+            with open(path, "w", encoding="utf-8") as f:
+                writer(f, n_records)
+            size = os.path.getsize(path)
+
+            start = time.perf_counter()
+            chars = drain(path)
+            elapsed = time.perf_counter() - start
+
+            tracemalloc.start()
+            drain(path)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            print(f"{ext:<6} {size / 1e6:8.1f} MB in  {chars / 1e6:8.1f} MB text  "
+                  f"{size / 1e6 / elapsed:7.1f} MB/s  peak {peak / 1e6:6.1f} MB")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
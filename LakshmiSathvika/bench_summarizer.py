@@ -0,0 +1,48 @@
+"""Latency and peak memory of the heuristic and TextRank summarizers"""
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from utils.summarizer import SmartSummarizer
+
+HEURISTIC_MAX_SENTENCES = 20_000   # the heuristic scorer takes minutes beyond this
+
+
+def make_text(n_sentences: int, vocab_size: int = 30_000, seed: int = 0) -> str:
+    """Sentences of 6-24 words drawn from a Zipf-like vocabulary"""
+    rng = np.random.default_rng(seed)
+    vocab = np.array([f"term{i}" for i in range(vocab_size)])
+    p = 1 / np.arange(1, vocab_size + 1) ** 1.1
+    p /= p.sum()
+    return " ".join(
+        " ".join(rng.choice(vocab, rng.integers(6, 25), p=p)).capitalize() + "."
+        for _ in range(n_sentences)
+    )
+
+
+def measure(text: str, method: str) -> tuple:
+    tracemalloc.start()
+    start = time.perf_counter()
+    summary = SmartSummarizer.summarize(text, method=method, hierarchical=False)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, len(summary.split())
+
+
+def run(sizes: list) -> None:
+    for n in sizes:
+        text = make_text(n)
+        print(f"{n:,} sentences ({len(text) / 1e6:.1f} MB)")
+        for method in ("heuristic", "textrank"):
+            if method == "heuristic" and n > HEURISTIC_MAX_SENTENCES:
+                print(f"  {method:<10} skipped (> {HEURISTIC_MAX_SENTENCES:,} sentences)")
+                continue
+            elapsed, peak, words = measure(text, method)
+            print(f"  {method:<10} {elapsed:8.2f}s  peak {peak / 1e6:7.1f} MB  summary {words:,} words")
+
+
+if __name__ == "__main__":
+    run([int(a) for a in sys.argv[1:]] or [1_000, 10_000, 100_000])
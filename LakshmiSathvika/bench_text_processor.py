@@ -0,0 +1,58 @@
+"""Throughput of the fused normalizer against the step-by-step cleaning it replaced"""
+import sys
+import time
+
+import numpy as np
+
+from utils.text_processor import MAX_WORKERS, normalize, clean_text, remove_stopwords, get_stats
+
+REPEATS = 3
+
+
+def make_text(megabytes: float, unicode: bool, seed: int = 0) -> str:
+    """Zipf-like words with punctuation and numbers; optionally some non-ASCII words"""
+    rng = np.random.default_rng(seed)
+    vocab = [f"term{i}" for i in range(20_000)] + ["The", "and", "of", "is", "THIS", "42", "3.5%", "(see", "below)"]
+    if unicode:
+        vocab += ["café", "ΟΔΟΣ", "naïve", "日本語", "Straße", "٣٤"]
+    p = 1 / np.arange(1, len(vocab) + 1) ** 1.1
+    p /= p.sum()
+    words = rng.choice(np.array(vocab), int(megabytes * 1e6 / 7), p=p)
+    return " ".join(words) + "."
+
+
+def stepwise(text: str) -> tuple:
+    cleaned = remove_stopwords(clean_text(text))
+    return cleaned, get_stats(text, cleaned)
+
+
+def best_time(fn, text: str) -> tuple:
+    best, result = float("inf"), None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(sizes: list, workers: int) -> None:
+    candidates = {
+        "step by step": stepwise,
+        "fused": lambda t: normalize(t, workers=1),
+        f"fused x{workers}": lambda t: normalize(t, workers=workers),
+    }
+    for mb in sizes:
+        for unicode in (False, True):
+            text = make_text(mb, unicode)
+            size = len(text.encode("utf-8")) / 1e6
+            print(f"{size:.1f} MB {'mixed unicode' if unicode else 'ascii'}")
+            expected = None
+            for name, fn in candidates.items():
+                elapsed, result = best_time(fn, text)
+                expected = expected or result
+                same = "identical" if result == expected else "DIFFERS"
+                print(f"  {name:<13} {size / elapsed:7.1f} MB/s  {same}")
+
+
+if __name__ == "__main__":
+    run([float(a) for a in sys.argv[1:]] or [8, 64], MAX_WORKERS)
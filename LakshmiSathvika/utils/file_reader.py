@@ -1,3 +1,5 @@
+import codecs
+import re
 import docx
 import pandas as pd
 import json
@@ -5,16 +7,67 @@ import xml.etree.ElementTree as ET
 from html.parser import HTMLParser
 import PyPDF2
 
+# Streaming settings
+STREAM_BLOCK_CHARS = 4 * 1024 * 1024   # default memory cap per yielded block
+CSV_START_ROWS = 1000
+HTML_SKIP_TAGS = {'script', 'style', 'noscript', 'template'}   # never page text
+
+# One JSON string and the whitespace after it; a ':' there makes it a key.
+# Anchored at the end of the previous match, so it never starts inside a string.
+JSON_STRING = re.compile(r'[^"]*"([^"\\]*(?:\\.[^"\\]*)*)"\s*(:?)', re.DOTALL)
+
 class SimpleHTMLParser(HTMLParser):
     def __init__(self):
         super().__init__()
         self.text = []
+        self._skip = 0
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in HTML_SKIP_TAGS:
+            self._skip += 1
+    
+    def handle_endtag(self, tag):
+        if tag in HTML_SKIP_TAGS and self._skip:
+            self._skip -= 1
     
     def handle_data(self, data):
-        self.text.append(data)
+        if not self._skip:
+            self.text.append(data)
     
     def get_text(self):
-        return ' '.join(self.text)
+        return ' '.join(t for t in self.text if not t.isspace())
+
+class StreamingHTMLParser(SimpleHTMLParser):
+    """SimpleHTMLParser fed in pieces: a text run split across feeds stays one run"""
+    def __init__(self):
+        super().__init__()
+        self._in_run = False
+    
+    def handle_data(self, data):
+        if self._skip:
+            return
+        if self._in_run:
+            self.text[-1] += data
+        else:
+            self.text.append(data)
+        self._in_run = True
+    
+    def handle_starttag(self, tag, attrs):
+        super().handle_starttag(tag, attrs)
+        self._in_run = False
+    
+    def handle_endtag(self, tag):
+        super().handle_endtag(tag)
+        self._in_run = False
+    
+    def handle_comment(self, data):
+        self._in_run = False
+    
+    def take_text(self, final=False):
+        """Join and drop the finished text runs; an open run waits for the next feed"""
+        keep = 1 if self._in_run and not final else 0
+        done, self.text = self.text[:len(self.text) - keep], self.text[len(self.text) - keep:]
+        return ' '.join(t for t in done if not t.isspace())
 
 def read_file(uploaded_file):
     """Read any uploaded file and return text content"""
@@ -47,17 +100,13 @@ def read_csv(file):
     return df.to_string()
 
 def read_json(file):
-    data = json.load(file)
-    return json.dumps(data, indent=2)
+    return ''.join(iter_json(file))
 
 def read_xml(file):
-    root = ET.fromstring(file.read())
-    return ET.tostring(root, encoding='unicode')
+    return ''.join(iter_xml(file))
 
 def read_html(file):
-    parser = SimpleHTMLParser()
-    parser.feed(file.read().decode('utf-8'))
-    return parser.get_text()
+    return ''.join(iter_html(file))
 
 def read_pdf(file):
     pdf_reader = PyPDF2.PdfReader(file)
@@ -67,4 +116,179 @@ def read_pdf(file):
     return text
 
 def read_text(file):
-    return file.read().decode('utf-8')
\ No newline at end of file
+    return file.read().decode('utf-8')
+
+# ---------------- Streaming readers ----------------
+# Each iter_* yields pieces whose concatenation is what the matching read_*
+# returns (up to column padding for CSV), without holding the whole text.
+
+def iter_docx(file, max_block_chars=STREAM_BLOCK_CHARS):
+    doc = docx.Document(file)
+    for i, para in enumerate(doc.paragraphs):
+        yield para.text if i == 0 else '\n' + para.text
+
+def iter_csv(file, max_block_chars=STREAM_BLOCK_CHARS):
+    """Rows rendered like df.to_string(), in chunks sized to max_block_chars"""
+    reader = pd.read_csv(file, iterator=True)
+    rows = CSV_START_ROWS
+    first = True
+    while True:
+        try:
+            chunk = reader.get_chunk(rows)
+        except StopIteration:
+            break
+        block = chunk.to_string(header=first)
+        yield block if first else '\n' + block
+        first = False
+        # Size the next chunk from this one's rendered length
+        rows = max(1, int(len(chunk) * max_block_chars / max(len(block), 1)))
+
+def _join_leaves(leaves, sep):
+    """Yield the non-blank leaves with sep between them, as sep.join would"""
+    first = True
+    for leaf in leaves:
+        if leaf and not leaf.isspace():
+            yield leaf if first else sep + leaf
+            first = False
+
+def _json_value(raw):
+    """Decode the escapes in a string's raw contents, if any"""
+    return json.loads('"' + raw + '"', strict=False) if '\\' in raw else raw
+
+def _json_strings(file, max_block_chars):
+    """
+    String values of a JSON document, read a block at a time; object keys,
+    numbers, literals and punctuation are skipped. The scan does not
+    validate the document.
+    """
+    carry = ''
+    for piece in iter_text(file, max_block_chars):
+        text = carry + piece
+        pos = 0
+        while True:
+            m = JSON_STRING.match(text, pos)
+            # A string at the very end might still turn out to be a key
+            if m is None or (not m.group(2) and m.end() == len(text)):
+                break
+            if not m.group(2):
+                yield _json_value(m.group(1))
+            pos = m.end()
+        # Keep only an unfinished string, not the punctuation before it
+        start = text.find('"', pos)
+        carry = text[start:] if start >= 0 else ''
+    m = JSON_STRING.match(carry)
+    if m and not m.group(2):
+        yield _json_value(m.group(1))
+
+def iter_json(file, max_block_chars=STREAM_BLOCK_CHARS):
+    """String values, one per line"""
+    yield from _join_leaves(_json_strings(file, max_block_chars), '\n')
+
+def _xml_texts(file):
+    """
+    Text and tail runs of an XML document in document order, dropping each
+    element once its text has been read so memory stays flat.
+    """
+    # Each open element with its last closed child, whose tail ends at the
+    # next sibling's start or the parent's end.
+    stack = []
+    for event, elem in ET.iterparse(file, events=('start', 'end')):
+        if event == 'start':
+            if stack:
+                parent, last = stack[-1]
+                if last is None:
+                    yield parent.text
+                    parent.text = None
+                else:
+                    yield last.tail
+                    parent.remove(last)
+                    stack[-1][1] = None
+            stack.append([elem, None])
+        else:
+            _, last = stack.pop()
+            if last is None:
+                yield elem.text
+            else:
+                yield last.tail
+                elem.remove(last)
+            # Not elem.clear(): the parser may already have set elem.tail
+            elem.text = None
+            elem.attrib.clear()
+            if stack:
+                stack[-1][1] = elem
+
+def iter_xml(file, max_block_chars=STREAM_BLOCK_CHARS):
+    """Text content of the elements, one run per line"""
+    yield from _join_leaves((t.strip() for t in _xml_texts(file) if t), '\n')
+
+def _html_texts(file, max_block_chars):
+    parser = StreamingHTMLParser()
+    for piece in iter_text(file, max_block_chars):
+        parser.feed(piece)
+        yield parser.take_text()
+    parser.close()
+    yield parser.take_text(final=True)
+
+def iter_html(file, max_block_chars=STREAM_BLOCK_CHARS):
+    """Visible text, fed to the parser a block at a time; script and style are skipped"""
+    yield from _join_leaves(_html_texts(file, max_block_chars), ' ')
+
+def iter_pdf(file, max_block_chars=STREAM_BLOCK_CHARS):
+    pdf_reader = PyPDF2.PdfReader(file)
+    for page in pdf_reader.pages:
+        yield page.extract_text()
+
+def iter_text(file, max_block_chars=STREAM_BLOCK_CHARS):
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    while True:
+        raw = file.read(max_block_chars)
+        text = decoder.decode(raw, final=not raw)
+        if text:
+            yield text
+        if not raw:
+            break
+
+STREAM_READERS = {
+    '.docx': iter_docx,
+    '.csv': iter_csv,
+    '.json': iter_json,
+    '.xml': iter_xml,
+    '.html': iter_html,
+    '.htm': iter_html,
+    '.pdf': iter_pdf,
+}
+
+def _whitespace_blocks(pieces, max_block_chars):
+    """Regroup pieces into blocks of about max_block_chars that end on whitespace"""
+    buffer = []
+    size = 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size < max_block_chars:
+            continue
+        text = ''.join(buffer)
+        cut = max(text.rfind(c) for c in ' \t\n\r')
+        if cut < 0 and size < 4 * max_block_chars:
+            # No break yet; give up waiting once far past the cap
+            buffer = [text]
+            continue
+        cut = cut + 1 if cut >= 0 else len(text)
+        yield text[:cut]
+        buffer = [text[cut:]]
+        size = len(buffer[0])
+    tail = ''.join(buffer)
+    if tail:
+        yield tail
+
+def iter_file(uploaded_file, max_block_chars=STREAM_BLOCK_CHARS):
+    """
+    Stream any uploaded file as text blocks that end on whitespace, so each
+    block can go through process_text or the summarizer on its own
+    """
+    file_name = uploaded_file.name.lower()
+    reader = next((fn for ext, fn in STREAM_READERS.items() if file_name.endswith(ext)), iter_text)
+    try:
+        yield from _whitespace_blocks(reader(uploaded_file, max_block_chars), max_block_chars)
+    except Exception as e:
+        raise Exception(f"Error processing {file_name}: {str(e)}")
\ No newline at end of file
@@ -1,9 +1,18 @@
+import os
 import re
 import nltk
-from collections import Counter
+import numpy as np
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 import heapq
 from nltk.tokenize import sent_tokenize, word_tokenize
 
+try:
+    from scipy import sparse
+except ImportError:  # graph ranking needs scipy; the heuristic scorer does not
+    sparse = None
+
 # Download NLTK data once
 try:
     nltk.data.find('punkt')
@@ -11,16 +20,75 @@ except:
     nltk.download('punkt', quiet=True)
     nltk.download('stopwords', quiet=True)
 
+# Graph ranking settings
+SIMILARITY_THRESHOLD = 0.2   # weakest sentence link kept in the graph
+MAX_NEIGHBOURS = 20          # strongest links kept per sentence
+MAX_DOC_FREQ = 0.02          # on very long texts, terms in a larger share of sentences are dropped
+DOC_FREQ_MIN_SENTENCES = 20_000   # below this the cutoff would drop the topic terms themselves
+BLOCK_CELLS = 4_000_000      # similarity rows are computed in blocks of at most this many cells
+DAMPING = 0.85
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Hierarchical summarization settings
+HIERARCHICAL_MIN_CHARS = 200_000    # longer texts are summarized section by section
+SECTION_SENTENCES = 400             # sentences per section
+TARGET_WORDS = 600                  # reduce rounds stop once the summary is this short
+MAX_WORKERS = os.cpu_count() or 1
+_pool = None
+_pool_workers = None
+
+
+@lru_cache(maxsize=1)
+def _stop_words() -> frozenset:
+    """NLTK English stopwords, loaded once per process"""
+    return frozenset(nltk.corpus.stopwords.words('english'))
+
+
+def _iter_sections(blocks, section_sentences: int):
+    """Sentence windows from streamed text; a sentence cut by a block edge is carried over"""
+    carry = ''
+    buffer = []
+    for block in blocks:
+        block = re.sub(r'\s+', ' ', block)
+        sentences = sent_tokenize(carry + block)
+        carry = sentences.pop() + ' ' if sentences else ''
+        buffer.extend(sentences)
+        while len(buffer) >= section_sentences:
+            yield ' '.join(buffer[:section_sentences])
+            del buffer[:section_sentences]
+    if carry.strip():
+        buffer.append(carry.strip())
+    if buffer:
+        yield ' '.join(buffer)
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """Process pool for section summaries, kept across calls"""
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != workers:
+        if _pool is not None:
+            _pool.shutdown(wait=False)
+        _pool = ProcessPoolExecutor(max_workers=workers)
+        _pool_workers = workers
+    return _pool
+
+
 class SmartSummarizer:
     """Fast and intelligent summarization using extractive methods"""
     
     @staticmethod
-    def summarize(text: str, use_ai: bool = False) -> str:
+    def summarize(text: str, use_ai: bool = False, method: str = "heuristic",
+                  hierarchical: bool = None, progress=None) -> str:
         """
         Generate meaningful summary from text
         Args:
             text: Input text to summarize
             use_ai: Whether to try AI summarization (slower)
+            method: "heuristic" (word frequency, position and length) or
+                "textrank" (graph ranking over sentence similarity)
+            hierarchical: Summarize section by section, then summarize the
+                summaries; by default only for texts over HIERARCHICAL_MIN_CHARS
+            progress: Optional callback(done, total, level) for hierarchical runs
         Returns:
             str: Generated summary
         """
@@ -31,13 +99,126 @@ class SmartSummarizer:
         text = re.sub(r'\s+', ' ', text.strip())
         
         # Generate summary based on preference
+        if hierarchical is None:
+            hierarchical = len(text) > HIERARCHICAL_MIN_CHARS
+        
         if use_ai:
             summary = SmartSummarizer._ai_summary(text)
+        elif hierarchical:
+            summary = SmartSummarizer._hierarchical_summary(text, method, progress=progress)
         else:
-            summary = SmartSummarizer._extractive_summary(text)
+            summary = SmartSummarizer._summarize_section(text, method)
         
         return summary
     
+    @staticmethod
+    def _summarize_section(text: str, method: str = "heuristic") -> str:
+        """Single-pass extractive summary with the chosen method"""
+        if method == "textrank":
+            return SmartSummarizer._textrank_summary(text)
+        return SmartSummarizer._extractive_summary(text)
+    
+    @staticmethod
+    def _hierarchical_summary(text: str, method: str = "heuristic", target_words: int = TARGET_WORDS,
+                              section_sentences: int = SECTION_SENTENCES, workers: int = MAX_WORKERS,
+                              progress=None, first_level: int = 1) -> str:
+        """
+        Map-reduce summary for very long texts: split into fixed sentence
+        windows, summarize the windows in parallel, join the section summaries
+        and repeat on the result until it fits one section or target_words
+        """
+        sentences = sent_tokenize(text)
+        level = first_level
+        while len(' '.join(sentences).split()) > target_words:
+            if len(sentences) > section_sentences:
+                sections = [' '.join(sentences[i:i + section_sentences])
+                            for i in range(0, len(sentences), section_sentences)]
+                summaries = SmartSummarizer._map_sections(sections, method, workers, level, progress)
+            else:
+                summaries = [SmartSummarizer._summarize_section(' '.join(sentences), method)]
+                if progress:
+                    progress(1, 1, level)
+            reduced = sent_tokenize(' '.join(summaries))
+            if len(reduced) >= len(sentences):
+                break
+            sentences = reduced
+            level += 1
+        
+        return SmartSummarizer._clean_summary(' '.join(sentences))
+    
+    @staticmethod
+    def summarize_stream(blocks, method: str = "heuristic", target_words: int = TARGET_WORDS,
+                         section_sentences: int = SECTION_SENTENCES, workers: int = MAX_WORKERS,
+                         progress=None) -> str:
+        """
+        Hierarchical summary of text streamed in blocks (see file_reader.iter_file).
+        Sections are summarized as they fill and their summaries are reduced
+        level by level as those fill in turn, so memory stays at a few
+        sections however long the input is.
+        Args:
+            progress: Optional callback(done, total, level); total is None
+                while the input is still being read
+        """
+        levels = []                 # levels[l]: summary sentences waiting for pass l + 2
+        in_flight = deque()
+        pool = _get_pool(workers) if workers > 1 else None
+        sections_done = 0
+        
+        def push(level, summary):
+            if level == len(levels):
+                levels.append([])
+            levels[level].extend(sent_tokenize(summary))
+            if len(levels[level]) >= section_sentences:
+                section = ' '.join(levels[level])
+                levels[level] = []
+                push(level + 1, SmartSummarizer._summarize_section(section, method))
+        
+        def collect():
+            nonlocal sections_done
+            result = in_flight.popleft()
+            push(0, result.result() if pool else result)
+            sections_done += 1
+            if progress:
+                progress(sections_done, None, 1)
+        
+        for section in _iter_sections(blocks, section_sentences):
+            if pool:
+                in_flight.append(pool.submit(SmartSummarizer._summarize_section, section, method))
+            else:
+                in_flight.append(SmartSummarizer._summarize_section(section, method))
+            # Results are taken in document order, with a few sections queued on the pool
+            while len(in_flight) > (2 * workers if pool else 0):
+                collect()
+        while in_flight:
+            collect()
+        
+        # Higher levels hold the earlier parts of the text
+        remaining = ' '.join(' '.join(level) for level in reversed(levels))
+        if not remaining:
+            return "Text is too short for summarization."
+        return SmartSummarizer._hierarchical_summary(remaining, method, target_words, section_sentences,
+                                                     workers, progress, first_level=len(levels) + 1)
+    
+    @staticmethod
+    def _map_sections(sections: list, method: str, workers: int, level: int, progress=None) -> list:
+        """Summarize sections on the process pool, reporting each one as it finishes"""
+        summaries = [None] * len(sections)
+        if workers <= 1 or len(sections) == 1:
+            for i, section in enumerate(sections):
+                summaries[i] = SmartSummarizer._summarize_section(section, method)
+                if progress:
+                    progress(i + 1, len(sections), level)
+            return summaries
+        
+        pool = _get_pool(workers)
+        futures = {pool.submit(SmartSummarizer._summarize_section, section, method): i
+                   for i, section in enumerate(sections)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            summaries[futures[future]] = future.result()
+            if progress:
+                progress(done, len(sections), level)
+        return summaries
+    
     @staticmethod
     def _extractive_summary(text: str) -> str:
         """Fast extractive summary using intelligent sentence selection"""
@@ -80,7 +261,7 @@ class SmartSummarizer:
         """Find the most important sentences using multiple criteria"""
         
         # 1. Word frequency analysis
-        stop_words = set(nltk.corpus.stopwords.words('english'))
+        stop_words = _stop_words()
         words = [w.lower() for w in word_tokenize(text) if w.isalnum() and w.lower() not in stop_words]
         word_freq = Counter(words)
         
@@ -123,6 +304,95 @@ class SmartSummarizer:
         top_indices = heapq.nlargest(top_count, sentence_scores, key=sentence_scores.get)
         return sorted(top_indices)
     
+    @staticmethod
+    def _textrank_summary(text: str) -> str:
+        """Extractive summary of the sentences that rank highest in a similarity graph"""
+        sentences = sent_tokenize(text)
+        
+        if len(sentences) <= 3:
+            return ' '.join(sentences)
+        if sparse is None:
+            return SmartSummarizer._extractive_summary(text)
+        
+        num_sentences = SmartSummarizer._get_optimal_sentence_count(len(sentences))
+        scores = SmartSummarizer._rank_sentences(SmartSummarizer._sentence_graph(sentences))
+        
+        top_indices = np.sort(np.argsort(-scores, kind="stable")[:num_sentences])
+        summary = ' '.join(sentences[i] for i in top_indices)
+        return SmartSummarizer._clean_summary(summary)
+    
+    @staticmethod
+    def _sentence_graph(sentences: list):
+        """
+        Sparse LexRank-style graph: TF-IDF cosine similarity between sentences,
+        keeping links of at least SIMILARITY_THRESHOLD and at most
+        MAX_NEIGHBOURS per sentence, so memory grows linearly with the text
+        """
+        # Tokenize once, straight into term ids
+        stop_words = _stop_words()
+        vocab = {}
+        rows, cols = [], []
+        for i, sentence in enumerate(sentences):
+            for word in WORD_PATTERN.findall(sentence.lower()):
+                if word not in stop_words:
+                    cols.append(vocab.setdefault(word, len(vocab)))
+                    rows.append(i)
+        n = len(sentences)
+        counts = sparse.csr_matrix(
+            (np.ones(len(cols)), (np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64))),
+            shape=(n, max(len(vocab), 1))
+        )
+        counts.sum_duplicates()
+        
+        # TF-IDF weights, unit-length rows
+        doc_freq = np.bincount(counts.indices, minlength=counts.shape[1])
+        idf = np.log(n / np.maximum(doc_freq, 1)) + 1.0
+        if n > DOC_FREQ_MIN_SENTENCES:
+            # Keeps the similarity blocks sparse enough to compute
+            idf[doc_freq > MAX_DOC_FREQ * n] = 0.0
+        tfidf = counts.multiply(idf).tocsr()
+        norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+        tfidf = sparse.diags(1.0 / np.maximum(norms, 1e-12)) @ tfidf
+        tfidf.eliminate_zeros()
+        transposed = tfidf.T.tocsr()
+        
+        # Similarities one block of rows at a time, pruned before the next block
+        block = max(16, BLOCK_CELLS // n)
+        parts = []
+        for start in range(0, n, block):
+            sim = tfidf[start:start + block] @ transposed
+            sim.data[sim.data < SIMILARITY_THRESHOLD] = 0
+            sim.eliminate_zeros()
+            sim = sim.tocoo()
+            keep = sim.row + start != sim.col
+            r, c, v = sim.row[keep] + start, sim.col[keep], sim.data[keep]
+            # Strongest MAX_NEIGHBOURS links of each row
+            order = np.lexsort((-v, r))
+            r, c, v = r[order], c[order], v[order]
+            first = np.searchsorted(r, r)
+            keep = np.arange(len(r)) - first < MAX_NEIGHBOURS
+            parts.append((r[keep], c[keep], v[keep]))
+        
+        r, c, v = (np.concatenate(p) for p in zip(*parts))
+        return sparse.csr_matrix((v, (r, c)), shape=(n, n))
+    
+    @staticmethod
+    def _rank_sentences(graph, tol: float = 1e-6, max_iter: int = 100) -> np.ndarray:
+        """PageRank scores of a weighted sentence graph by power iteration"""
+        n = graph.shape[0]
+        out_weight = np.asarray(graph.sum(axis=1)).ravel()
+        dangling = out_weight == 0
+        transition = (sparse.diags(1.0 / np.where(dangling, 1.0, out_weight)) @ graph).T.tocsr()
+        
+        scores = np.full(n, 1.0 / n)
+        for _ in range(max_iter):
+            # Sentences with no links spread their score evenly
+            new = DAMPING * (transition @ scores + scores[dangling].sum() / n) + (1 - DAMPING) / n
+            if np.abs(new - scores).sum() < tol:
+                return new
+            scores = new
+        return scores
+    
     @staticmethod
     def _order_sentences_intelligently(important_indices: list, total_sentences: int) -> list:
         """Order sentences to maintain coherence"""
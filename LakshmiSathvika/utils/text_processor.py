@@ -1,16 +1,86 @@
+import os
 import re
 import string
+from concurrent.futures import ProcessPoolExecutor
+from itertools import filterfalse
 
 STOP_WORDS = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
               'of', 'with', 'is', 'was', 'are', 'were', 'been', 'be', 'have', 'has',
               'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may',
               'might', 'must', 'can', 'this', 'that', 'these', 'those'}
 
+# Normalizer settings
+PARALLEL_MIN_CHARS = 16 * 1024 * 1024   # smaller texts cost more to ship to workers than to clean
+CHUNK_CHARS = 4 * 1024 * 1024
+MAX_WORKERS = os.cpu_count() or 1
+_pool = None
+_pool_workers = None
+
+# ASCII punctuation and digits are deleted from the UTF-8 bytes in one
+# table pass (ASCII bytes never occur inside a multi-byte character);
+# str.translate is several times slower once the text holds any non-ASCII.
+_ASCII_DELETE = (string.punctuation + string.digits).encode()
+_ASCII_BYTES = bytes(range(128))
+_DIGITS = re.compile(r'\d+')
+_SPACE = re.compile(r'\s')
+
 def process_text(text):
     """Apply all preprocessing steps to text"""
-    text = clean_text(text)
-    text = remove_stopwords(text)
-    return text
+    return normalize(text)[0]
+
+def normalize(text, workers=MAX_WORKERS):
+    """
+    process_text and get_stats together, in one pass over the text. Texts
+    over PARALLEL_MIN_CHARS are cut on whitespace and cleaned on a process pool.
+    """
+    if workers <= 1 or len(text) < PARALLEL_MIN_CHARS:
+        return _normalize(text)
+    pieces = []
+    stats = {'original_words': 0, 'original_chars': 0, 'cleaned_words': 0, 'cleaned_chars': 0}
+    for cleaned, counts in _get_pool(workers).map(_normalize, _whitespace_chunks(text, CHUNK_CHARS)):
+        if cleaned:
+            pieces.append(cleaned)
+        for key in stats:
+            stats[key] += counts[key]
+    cleaned = ' '.join(pieces)
+    stats['cleaned_chars'] = len(cleaned)
+    return cleaned, stats
+
+def _normalize(text):
+    # Same result as clean_text then remove_stopwords: lower, drop
+    # punctuation and \d, split once, filter stopwords, join once.
+    raw = text.lower().encode('utf-8', 'surrogatepass').translate(None, _ASCII_DELETE)
+    cleaned = raw.decode('utf-8', 'surrogatepass')
+    # \d also matches non-ASCII digits; look for those among the non-ASCII characters only
+    if not raw.isascii() and _DIGITS.search(raw.translate(None, _ASCII_BYTES).decode('utf-8', 'surrogatepass')):
+        cleaned = _DIGITS.sub('', cleaned)
+    words = list(filterfalse(STOP_WORDS.__contains__, cleaned.split()))
+    cleaned = ' '.join(words)
+    return cleaned, {
+        'original_words': len(text.split()),
+        'original_chars': len(text),
+        'cleaned_words': len(words),
+        'cleaned_chars': len(cleaned)
+    }
+
+def _whitespace_chunks(text, chunk_chars):
+    """Slices of about chunk_chars that end just after a whitespace character"""
+    start = 0
+    while start < len(text):
+        m = _SPACE.search(text, start + chunk_chars)
+        end = m.end() if m else len(text)
+        yield text[start:end]
+        start = end
+
+def _get_pool(workers):
+    """Process pool for large texts, kept across calls"""
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != workers:
+        if _pool is not None:
+            _pool.shutdown(wait=False)
+        _pool = ProcessPoolExecutor(max_workers=workers)
+        _pool_workers = workers
+    return _pool
 
 def clean_text(text):
     """Remove punctuation, numbers and extra spaces"""
@@ -24,6 +94,27 @@ def remove_stopwords(text):
     filtered_words = [word for word in words if word not in STOP_WORDS]
     return ' '.join(filtered_words)
 
+def iter_process_text(blocks, stats=None):
+    """
+    process_text for text streamed in blocks that break on whitespace: the
+    yielded pieces concatenate to process_text of the whole text. If a dict
+    is passed as stats, it ends up holding the get_stats counts.
+    """
+    counts = {'original_words': 0, 'original_chars': 0, 'cleaned_words': 0, 'cleaned_chars': 0}
+    first = True
+    for block in blocks:
+        cleaned, block_counts = _normalize(block)
+        counts['original_words'] += block_counts['original_words']
+        counts['original_chars'] += block_counts['original_chars']
+        if cleaned:
+            piece = cleaned if first else ' ' + cleaned
+            counts['cleaned_words'] += block_counts['cleaned_words']
+            counts['cleaned_chars'] += len(piece)
+            first = False
+            yield piece
+    if stats is not None:
+        stats.update(counts)
+
 def get_stats(original, cleaned):
     return {
         'original_words': len(original.split()),